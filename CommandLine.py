@@ -0,0 +1,274 @@
+"""
+    Este módulo es el punto de entrada por línea de comandos de la aplicación, para ejecutar los generadores sin
+    interfaz gráfica. Solo importa la capa del modelo (nunca PyQt6, pyqtgraph ni matplotlib), así que puede usarse en
+    servidores sin pantalla. Los valores se generan y se escriben por bloques, con memoria acotada.
+
+    Ejemplos:
+        python -m CommandLine lcm --xo 7 --k 3 --c 5 --g 31 --iterations 1000000 --output lcm.txt
+        python -m CommandLine udm --min 0 --max 10 --iterations 100 --seed 42 --values ni
+        python -m CommandLine mcm --xo 17 --t 5 --g 20 --iterations 1000 --format u32 --compression gzip -o mcm
+        python -m CommandLine udm --iterations 100000000 --seed 1 --format f32 -o udm --tests
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from model.BinaryExporter import BinaryExporter
+from model.CompressedExporter import CompressedExporter
+from model.LinearCongruentialMethod import LinearCongruentialMethod
+from model.MiddleSquareMethod import MiddleSquareMethod
+from model.MultiplicativeCongruentialMethod import MultiplicativeCongruentialMethod
+from model.NormalInvDistributionMethod import NormalInvDistributionMethod
+from model.OutputPrecision import OutputPrecision
+from model.RandomSource import RandomSource
+from model.StatisticalTests import StatisticalTests
+from model.StreamingStatistics import StreamingStatistics
+from model.TextExporter import TextExporter
+from model.UniformDistributionMethod import UniformDistributionMethod
+
+# Columnas de cada bloque de iter_chunks según el método
+CHUNK_COLUMNS = {
+    'msm': ('xi', 'ri', 'ni'),
+    'lcm': ('xi', 'ri', 'ni'),
+    'mcm': ('xi', 'ri', 'ni'),
+    'udm': ('ri', 'ni'),
+    'nidm': ('ri', 'ni'),
+}
+
+# Mayor exponente g admitido: Ri divide por 2^g - 1, que debe poder representarse como float
+MAX_MODULUS_EXPONENT = 1023
+
+
+def createParser():
+    """
+        Esta función construye el analizador de argumentos, con un subcomando por método de generación.
+    """
+    parser = argparse.ArgumentParser(prog='python -m CommandLine',
+                                     description='Generate pseudorandom numbers without the graphical interface.')
+    subparsers = parser.add_subparsers(dest='method', required=True)
+
+    msm = subparsers.add_parser('msm', help='Middle Square Method')
+    msm.add_argument('--seed', type=int, required=True, help='initial seed')
+
+    lcm = subparsers.add_parser('lcm', help='Linear Congruential Method')
+    lcm.add_argument('--xo', type=int, required=True, help='initial seed')
+    lcm.add_argument('--k', type=int, required=True, help='multiplier parameter (a = 1 + 2k)')
+    lcm.add_argument('--c', type=int, required=True, help='increment')
+    lcm.add_argument('--g', type=int, required=True, help='modulus exponent (m = 2^g)')
+
+    mcm = subparsers.add_parser('mcm', help='Multiplicative Congruential Method')
+    mcm.add_argument('--xo', type=int, required=True, help='initial seed')
+    mcm.add_argument('--t', type=int, required=True, help='multiplier parameter (a = 8t + 3)')
+    mcm.add_argument('--g', type=int, required=True, help='modulus exponent (m = 2^g)')
+
+    udm = subparsers.add_parser('udm', help='Uniform Distribution Method')
+    udm.add_argument('--seed', type=int, default=None, help='seed of the random source (default: system entropy)')
+    udm.add_argument('--bit-generator', default='PCG64', choices=list(RandomSource.BIT_GENERATORS))
+
+    nidm = subparsers.add_parser('nidm', help='Normal Inverse Distribution Method')
+    nidm.add_argument('--xi-amount', type=int, required=True, help='amount of Xi values used for the mean and deviation')
+    nidm.add_argument('--seed', type=int, default=None, help='seed of the random source (default: system entropy)')
+    nidm.add_argument('--bit-generator', default='PCG64', choices=list(RandomSource.BIT_GENERATORS))
+
+    for subparser in subparsers.choices.values():
+        subparser.add_argument('--min', type=float, default=0, help='minimum Ni value')
+        subparser.add_argument('--max', type=float, default=1, help='maximum Ni value')
+        subparser.add_argument('--iterations', '-n', type=int, required=True, help='amount of values to generate')
+        subparser.add_argument('--values', default='ri', choices=['xi', 'ri', 'ni'], help='column to write')
+        subparser.add_argument('--format', default='txt', choices=['txt'] + list(BinaryExporter.FORMATS),
+                               help='output format')
+        subparser.add_argument('--compression', default=None, choices=list(CompressedExporter.COMPRESSIONS))
+        subparser.add_argument('--decimals', type=int, default=None,
+                               help='round Ri/Ni values to this many decimals (default: full precision)')
+        subparser.add_argument('--chunk-size', type=int, default=1 << 18, help='values generated per block')
+        subparser.add_argument('--output', '-o', default='-',
+                               help="output file, without extension for binary or compressed formats ('-' is stdout)")
+        subparser.add_argument('--tests', action='store_true',
+                               help='run the statistical tests on the generated Ri values and print the report to stderr')
+        subparser.add_argument('--statistics', action='store_true',
+                               help='accumulate the Ri statistics while generating, with constant memory, and print '
+                                    'them to stderr')
+        subparser.add_argument('--alpha', type=float, default=0.05, help='significance level of the statistical tests')
+    return parser
+
+
+def validateArguments(parser, arguments):
+    """
+        Esta función aplica las mismas validaciones que la interfaz gráfica y termina con un error si alguna falla.
+    """
+    if arguments.min > arguments.max:
+        parser.error("The minimum value cannot be greater than the maximum value.")
+    if arguments.iterations < 0:
+        parser.error("The number of iterations cannot be negative.")
+    if arguments.chunk_size <= 0:
+        parser.error("The chunk size must be positive.")
+    if arguments.method in ('udm', 'nidm') and arguments.seed is not None and arguments.seed < 0:
+        parser.error("The seed cannot be negative.")
+    if arguments.method == 'nidm' and arguments.xi_amount < 1:
+        parser.error("The amount of Xi values must be at least 1.")
+    if arguments.method == 'msm' and arguments.seed <= 0:
+        parser.error("The seed must be a positive number.")
+    if arguments.method == 'lcm' and min(arguments.xo, arguments.k, arguments.c) < 0:
+        parser.error("The values of xo, k, and c cannot be negative.")
+    if arguments.method == 'mcm' and min(arguments.xo, arguments.t) < 0:
+        parser.error("The values of xo and t cannot be negative.")
+    if arguments.method in ('lcm', 'mcm') and not 1 <= arguments.g <= MAX_MODULUS_EXPONENT:
+        parser.error(f"The value of g must be between 1 and {MAX_MODULUS_EXPONENT}.")
+    if arguments.method == 'lcm':
+        if arguments.c == 0:
+            parser.error("The value of c cannot be 0.")
+        if arguments.g <= max(arguments.xo, arguments.k, arguments.c):
+            parser.error("The value of g must be greater than the values of xo, k, and c.")
+    if arguments.method == 'mcm' and arguments.g <= max(arguments.xo, arguments.t):
+        parser.error("The value of g must be greater than the values of xo and t.")
+    if arguments.values not in CHUNK_COLUMNS[arguments.method]:
+        parser.error(f"The '{arguments.method}' method does not generate {arguments.values} values.")
+    if arguments.format in ('u32', 'u64') and arguments.values != 'xi':
+        parser.error(f"The '{arguments.format}' format only stores Xi values; use --values xi.")
+    if arguments.values == 'xi' and arguments.format in ('f64', 'f32', 'npy'):
+        parser.error("Xi values are integers; use the 'txt', 'u32' or 'u64' format.")
+    if arguments.format == 'npy' and (arguments.compression or arguments.output == '-'):
+        parser.error("The 'npy' format needs an uncompressed output file.")
+    if not 0 < arguments.alpha < 1:
+        parser.error("The significance level must be between 0 and 1.")
+    if (arguments.tests or arguments.statistics) and arguments.iterations < 2:
+        parser.error("The statistical tests need at least 2 iterations.")
+
+
+def createMethod(arguments):
+    """
+        Esta función construye el objeto del método de generación pedido con sus parámetros.
+    """
+    if arguments.method == 'msm':
+        return MiddleSquareMethod(arguments.seed, arguments.min, arguments.max, arguments.iterations)
+    if arguments.method == 'lcm':
+        return LinearCongruentialMethod(arguments.xo, arguments.k, arguments.c, arguments.g, arguments.min,
+                                        arguments.max, arguments.iterations)
+    if arguments.method == 'mcm':
+        return MultiplicativeCongruentialMethod(arguments.xo, arguments.t, arguments.g, arguments.min, arguments.max,
+                                                arguments.iterations)
+    if arguments.method == 'udm':
+        return UniformDistributionMethod(arguments.min, arguments.max, arguments.iterations, arguments.seed,
+                                         arguments.bit_generator)
+    return NormalInvDistributionMethod(arguments.xi_amount, arguments.min, arguments.max, arguments.iterations,
+                                       arguments.seed, arguments.bit_generator)
+
+
+def createExporter(arguments):
+    """
+        Esta función construye el exportador correspondiente al formato y la compresión pedidos.
+    """
+    if arguments.format == 'txt':
+        exporter = TextExporter(chunk_size=arguments.chunk_size)
+    else:
+        exporter = BinaryExporter(arguments.format, chunk_size=arguments.chunk_size)
+    if arguments.compression is not None:
+        exporter = CompressedExporter(exporter, arguments.compression, chunk_size=arguments.chunk_size)
+    return exporter
+
+
+def generateChunks(method, arguments, ri_chunks=None, statistics=None):
+    """
+        Esta función recorre los bloques del método y devuelve solo la columna pedida, redondeada si corresponde.
+        Si se recibe la lista 'ri_chunks', también guarda en ella los bloques de Ri con precisión completa, para las
+        pruebas estadísticas. Si se recibe un StreamingStatistics, el método acumula en él cada bloque de Ri.
+    """
+    column = CHUNK_COLUMNS[arguments.method].index(arguments.values)
+    ri_column = CHUNK_COLUMNS[arguments.method].index('ri')
+
+    def columns():
+        for chunk in method.iter_chunks(arguments.chunk_size, statistics):
+            if ri_chunks is not None:
+                ri_chunks.append(chunk[ri_column])
+            yield chunk[column]
+
+    chunks = columns()
+    if arguments.values != 'xi':
+        chunks = OutputPrecision(arguments.decimals).applyChunks(chunks)
+    return chunks
+
+
+def writeStandardOutput(exporter, chunks):
+    """
+        Esta función escribe los bloques en la salida estándar con el formato del exportador.
+    """
+    stream = sys.stdout.buffer
+    if isinstance(exporter, CompressedExporter):
+        for count, member in exporter.compressChunks(chunks):
+            stream.write(member)
+    elif isinstance(exporter, TextExporter):
+        for chunk in chunks:
+            stream.write(exporter.formatChunk(chunk).encode('ascii'))
+    else:
+        for chunk in chunks:
+            stream.write(memoryview(exporter.convertChunk(chunk)))
+    stream.flush()
+
+
+def getParameters(arguments):
+    """
+        Esta función devuelve los parámetros de la generación que se guardan en el encabezado de los formatos binarios.
+    """
+    excluded = ('values', 'format', 'compression', 'decimals', 'chunk_size', 'output', 'tests', 'statistics', 'alpha')
+    return {name: value for name, value in vars(arguments).items() if name not in excluded}
+
+
+def runTests(arguments, ri_chunks, statistics):
+    """
+        Esta función escribe en la salida de errores, para no mezclarlos con los valores escritos en la salida
+        estándar, las estadísticas acumuladas durante la generación y el informe de las pruebas estadísticas sobre los
+        valores Ri, según lo pedido. Devuelve 1 si alguna prueba falla.
+    """
+    results = []
+    if statistics is not None:
+        print(f"{statistics.count} values, mean {statistics.mean:.6f}, variance {statistics.getVariance():.6f}, "
+              f"min {statistics.minimum:.6f}, max {statistics.maximum:.6f}, runs {statistics.getRuns()}",
+              file=sys.stderr)
+        if not arguments.tests:
+            results = statistics.report()
+    if arguments.tests:
+        results = StatisticalTests(arguments.alpha).runAll(np.concatenate(ri_chunks))
+    print(StatisticalTests.formatReport(results), file=sys.stderr)
+    return 0 if all(result['passed'] for result in results) else 1
+
+
+def main(argv=None):
+    """
+        Esta función analiza los argumentos, genera los valores por bloques y los escribe en el destino pedido.
+    """
+    parser = createParser()
+    arguments = parser.parse_args(argv)
+    validateArguments(parser, arguments)
+
+    method = createMethod(arguments)
+    exporter = createExporter(arguments)
+    ri_chunks = [] if arguments.tests else None
+    statistics = StreamingStatistics(alpha=arguments.alpha) if arguments.statistics else None
+    chunks = generateChunks(method, arguments, ri_chunks, statistics)
+    checked = arguments.tests or arguments.statistics
+
+    if arguments.output == '-':
+        writeStandardOutput(exporter, chunks)
+        return runTests(arguments, ri_chunks, statistics) if checked else 0
+
+    # Los archivos binarios y comprimidos reciben la extensión de su formato, igual que en la interfaz gráfica
+    path = arguments.output
+    if arguments.format != 'txt' or arguments.compression is not None:
+        path += exporter.getExtension()
+
+    if isinstance(exporter, TextExporter):
+        exporter.writeChunks(path, chunks)
+    elif isinstance(exporter, CompressedExporter):
+        exporter.writeChunks(path, chunks, getParameters(arguments))
+    else:
+        exporter.writeChunks(path, chunks, arguments.iterations, getParameters(arguments))
+    return runTests(arguments, ri_chunks, statistics) if checked else 0
+
+
+if __name__ == "__main__":
+    """
+        Este es el punto de entrada de la línea de comandos.
+    """
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+    Este módulo verifica el presupuesto de tiempo de arranque de la aplicación usando 'python -X importtime'.
+    Importa cada punto de entrada en un intérprete nuevo, mide el tiempo acumulado de la importación y comprueba que
+    las dependencias pesadas (scipy, matplotlib, pyqtgraph) no se carguen al iniciar, sino solo cuando se usan.
+
+    Uso:
+        python -m ImportBudget            (termina con código 1 si se excede algún presupuesto)
+        python -m ImportBudget --runs 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+# Puntos de entrada medidos: (módulo, presupuesto en milisegundos, módulos que no deben importarse)
+# Los presupuestos incluyen la importación de numpy, que por sí sola ronda los 100 ms.
+TARGETS = [
+    ('CommandLine', 400, ('PyQt6', 'pyqtgraph', 'matplotlib', 'scipy')),
+    ('model.LinearCongruentialMethod', 300, ('PyQt6', 'pyqtgraph', 'matplotlib', 'scipy')),
+    ('model.MultiplicativeCongruentialMethod', 300, ('PyQt6', 'pyqtgraph', 'matplotlib', 'scipy')),
+    ('model.MiddleSquareMethod', 300, ('PyQt6', 'pyqtgraph', 'matplotlib', 'scipy')),
+    ('model.UniformDistributionMethod', 300, ('PyQt6', 'pyqtgraph', 'matplotlib', 'scipy')),
+    ('model.NormalInvDistributionMethod', 300, ('PyQt6', 'pyqtgraph', 'matplotlib', 'scipy')),
+    ('Presenter', 800, ('pyqtgraph', 'matplotlib', 'scipy')),
+]
+
+
+def measureImport(module):
+    """
+        Esta función importa 'module' en un intérprete nuevo con '-X importtime'.
+        Devuelve el tiempo acumulado de la importación en milisegundos y el conjunto de módulos importados, o None
+        si el módulo no se pudo importar (por ejemplo, porque falta PyQt6).
+    """
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                             cwd=project_dir, capture_output=True, text=True)
+    if process.returncode != 0:
+        return None
+
+    # Cada línea tiene la forma 'import time: propio | acumulado | módulo'
+    cumulative = 0
+    imported = set()
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or line.endswith('| imported package'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if not fields[1].strip().isdigit():
+            continue
+        name = fields[2].strip()
+        imported.add(name)
+        if name == module:
+            cumulative = int(fields[1])
+    return cumulative / 1000, imported
+
+
+def checkTarget(module, budget, forbidden, runs):
+    """
+        Esta función mide un punto de entrada 'runs' veces y compara el menor tiempo con el presupuesto.
+        Devuelve una tupla (estado, mensaje), donde el estado es 'ok', 'fail' o 'skip'.
+    """
+    measurements = [measureImport(module) for _ in range(runs)]
+    if any(measurement is None for measurement in measurements):
+        return 'skip', f"{module}: cannot be imported in this environment"
+
+    elapsed = min(measurement[0] for measurement in measurements)
+    loaded = sorted({name.split('.')[0] for name in measurements[0][1]} & set(forbidden))
+    if loaded:
+        return 'fail', f"{module}: imports {', '.join(loaded)} at startup"
+    if elapsed > budget:
+        return 'fail', f"{module}: {elapsed:.1f} ms exceeds the budget of {budget} ms"
+    return 'ok', f"{module}: {elapsed:.1f} ms (budget {budget} ms)"
+
+
+def main(argv=None):
+    """
+        Esta función verifica todos los puntos de entrada y devuelve 1 si alguno excede su presupuesto.
+    """
+    parser = argparse.ArgumentParser(prog='python -m ImportBudget',
+                                     description='Check the import-time budget of the application entry points.')
+    parser.add_argument('--runs', type=int, default=3, help='measurements per entry point (the fastest is used)')
+    arguments = parser.parse_args(argv)
+
+    failed = False
+    for module, budget, forbidden in TARGETS:
+        status, message = checkTarget(module, budget, forbidden, arguments.runs)
+        print(f"[{status}] {message}")
+        failed = failed or status == 'fail'
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    """
+        Este es el punto de entrada de la verificación del presupuesto de importación.
+    """
+    sys.exit(main())
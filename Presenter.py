@@ -1,12 +1,22 @@
 import sys
 import os
 
+import numpy as np
+from PyQt6.QtCore import QThreadPool
 from PyQt6.QtWidgets import QApplication, QMessageBox
+from model.BinaryExporter import BinaryExporter
+from model.CompressedExporter import CompressedExporter
 from model.LinearCongruentialMethod import LinearCongruentialMethod
 from model.MiddleSquareMethod import MiddleSquareMethod
 from model.MultiplicativeCongruentialMethod import MultiplicativeCongruentialMethod
 from model.NormalInvDistributionMethod import NormalInvDistributionMethod
+from model.OutputPrecision import OutputPrecision
+from model.StatisticalTests import StatisticalTests
+from model.StreamingStatistics import StreamingStatistics
+from model.TextExporter import TextExporter
 from model.UniformDistributionMethod import UniformDistributionMethod
+from view.GenerationWorker import GenerationWorker
+from view.HistogramImage import saveHistogramImage
 from view.MainFrame import MainFrame
 
 class Presenter:
@@ -33,6 +43,12 @@ class Presenter:
         self.main_frame.tab4.generate_button_clicked.connect(self.manage_tab4_info)
         self.main_frame.tab5.generate_button_clicked.connect(self.manage_tab5_info)
 
+        # Conecta el botón cancelar de la ventana principal con la generación en curso
+        self.main_frame.cancel_button_clicked.connect(self.cancel_generation)
+
+        # Conecta el botón de pruebas estadísticas con los valores de la pestaña actual
+        self.main_frame.tests_button_clicked.connect(self.run_tests)
+
         # Define las rutas del directorio del proyecto y del directorio de salida
         self.project_dir = os.path.dirname(os.path.dirname(__file__))
         self.output_dir = os.path.join(self.project_dir, 'Numbers Generated')
@@ -40,6 +56,220 @@ class Presenter:
         # Crea el directorio de salida si no existe
         os.makedirs(self.output_dir, exist_ok=True)
 
+        # Define la precisión con la que se muestran y exportan los valores Ri y Ni
+        self.output_precision = OutputPrecision(5)
+
+        # Define el formato de los archivos de salida: 'txt' o uno de los formatos binarios de BinaryExporter
+        self.output_format = 'txt'
+
+        # Define la compresión de los archivos de salida: None, 'gzip', 'bz2' o 'xz'
+        self.output_compression = None
+
+        # Define el grupo de hilos en el que se generan los valores, el trabajador en curso y el tamaño de bloque con
+        # el que se informa el avance y se comprueba la cancelación
+        self.thread_pool = QThreadPool.globalInstance()
+        self.worker = None
+        self.chunk_size = 65536
+
+        # Define si los histogramas de las pestañas 4 y 5 también se exportan como imagen PNG al directorio de salida,
+        # y el trabajador que la dibuja en segundo plano
+        self.export_histogram_image = False
+        self.image_worker = None
+
+        # Define el nivel de significancia de las pruebas estadísticas y el trabajador que las aplica
+        self.tests_alpha = 0.05
+        self.tests_worker = None
+
+    def start_worker(self, task, tab, histogram_name=None, statistics=None):
+        """
+            Este método ejecuta la tarea de generación en un hilo del QThreadPool, mostrando su avance en la ventana
+            principal. Al terminar, los resultados se muestran en la pestaña 'tab' y, si se indica 'histogram_name',
+            su histograma se exporta como imagen con ese nombre. Si se recibe el StreamingStatistics que la tarea
+            acumula durante la generación, su resumen se muestra en la barra de estado.
+            Solo se permite una generación a la vez.
+        """
+        if self.worker is not None:
+            QMessageBox.warning(self.main_frame, "Warning", "A generation is already running.")
+            return
+
+        self.worker = GenerationWorker(task)
+        self.worker.signals.progress.connect(self.main_frame.set_progress)
+        self.worker.signals.finished.connect(lambda result: self.show_results(tab, result, histogram_name, statistics))
+        self.worker.signals.failed.connect(self.show_generation_error)
+        self.worker.signals.cancelled.connect(self.finish_generation)
+
+        self.main_frame.start_progress()
+        self.thread_pool.start(self.worker)
+
+    def cancel_generation(self):
+        """
+            Este método pide a la generación en curso que se detenga al terminar el bloque actual.
+        """
+        if self.worker is not None:
+            self.worker.cancel()
+            self.main_frame.cancel_progress()
+
+    def finish_generation(self):
+        """
+            Este método libera el trabajador de la generación y oculta la barra de progreso.
+        """
+        self.worker = None
+        self.main_frame.finish_progress()
+
+    def show_results(self, tab, result, histogram_name=None, statistics=None):
+        """
+            Este método muestra en la pestaña 'tab' los valores generados por el trabajador.
+        """
+        self.finish_generation()
+        tab.set_data(*result)
+        tab.generateTable()
+
+        if statistics is not None:
+            self.main_frame.statusBar().showMessage("Ri: " + statistics.formatSummary())
+
+        if histogram_name is not None and self.export_histogram_image:
+            self.export_histogram(tab, histogram_name)
+
+    def export_histogram(self, tab, base_name):
+        """
+            Este método guarda el histograma ya calculado de la pestaña 'tab' como imagen PNG en el directorio de
+            salida. La imagen se dibuja en un hilo del QThreadPool, por lo que la ventana sigue respondiendo.
+        """
+        histogram = tab.get_histogram()
+        if histogram is None:
+            return
+
+        path = os.path.join(self.output_dir, base_name + '.png')
+        title = tab.get_histogram_title()
+        self.image_worker = GenerationWorker(lambda worker: saveHistogramImage(path, histogram, title))
+        self.image_worker.signals.failed.connect(
+            lambda message: QMessageBox.critical(self.main_frame, "Error", message))
+        self.thread_pool.start(self.image_worker)
+
+    def show_generation_error(self, message):
+        """
+            Este método muestra el error con el que terminó la generación.
+        """
+        self.finish_generation()
+        QMessageBox.critical(self.main_frame, "Error", message)
+
+    def run_tests(self):
+        """
+            Este método aplica las pruebas estadísticas a los valores Ri de la pestaña actual en un hilo del
+            QThreadPool y muestra el informe al terminar.
+        """
+        if self.tests_worker is not None:
+            QMessageBox.warning(self.main_frame, "Warning", "The statistical tests are already running.")
+            return
+
+        tab = self.main_frame.tab_widget.currentWidget()
+        ri_values = tab.get_ri_values()
+        if ri_values is None or len(ri_values) < 2:
+            QMessageBox.warning(self.main_frame, "Warning", "Generate at least 2 numbers before running the tests.")
+            return
+
+        tests = StatisticalTests(self.tests_alpha)
+        self.tests_worker = GenerationWorker(lambda worker: tests.runAll(ri_values))
+        self.tests_worker.signals.finished.connect(self.show_test_report)
+        self.tests_worker.signals.failed.connect(self.show_test_error)
+        self.main_frame.tests_button.setEnabled(False)
+        self.thread_pool.start(self.tests_worker)
+
+    def finish_tests(self):
+        """
+            Este método libera el trabajador de las pruebas y vuelve a habilitar su botón.
+        """
+        self.tests_worker = None
+        self.main_frame.tests_button.setEnabled(True)
+
+    def show_test_report(self, results):
+        """
+            Este método muestra el informe de las pruebas estadísticas, con el resultado de cada una.
+        """
+        self.finish_tests()
+        QMessageBox.information(self.main_frame, "Statistical Tests",
+                                f"Significance level: {self.tests_alpha}\n\n" + StatisticalTests.formatReport(results))
+
+    def show_test_error(self, message):
+        """
+            Este método muestra el error con el que terminaron las pruebas estadísticas.
+        """
+        self.finish_tests()
+        QMessageBox.critical(self.main_frame, "Error", message)
+
+    def collect_chunks(self, worker, chunks, total, columns):
+        """
+            Este método recorre los bloques de iter_chunks de un método, informando el avance al trabajador y
+            deteniéndose si se pidió cancelar. 'total' es la cantidad de valores de toda la tarea; las tareas pasan el
+            doble de las iteraciones, porque la segunda mitad del avance corresponde a la escritura del archivo.
+            Devuelve una tupla con los arreglos completos de cada una de las 'columns' columnas, o None si la
+            generación fue cancelada.
+        """
+        collected = []
+        done = 0
+        worker.reportProgress(done, total)
+        for chunk in chunks:
+            if worker.isCancelled():
+                return None
+            collected.append(chunk)
+            done += len(chunk[0])
+            worker.reportProgress(done, total)
+
+        if not collected:
+            return tuple(np.empty(0) for _ in range(columns))
+        return tuple(np.concatenate(column) for column in zip(*collected))
+
+    def export_values(self, base_name, ri_values, xi_values=None, parameters=None, worker=None):
+        """
+            Este método escribe los valores generados en el directorio de salida con el formato seleccionado.
+
+            En formato 'txt' escribe un valor Ri por línea. En los formatos binarios escribe los valores Ri, o los
+            valores Xi si el formato es entero, junto con un encabezado JSON con los parámetros de la generación.
+            Si se seleccionó una compresión, el archivo se comprime por bloques en paralelo.
+            Si se recibe el trabajador de la tarea, los valores se escriben por bloques informando el avance (la
+            segunda mitad de la barra) y, si se pide cancelar, la escritura se detiene y el archivo incompleto se borra.
+        """
+        if self.output_format == 'txt':
+            exporter = TextExporter()
+            values = ri_values
+        else:
+            exporter = BinaryExporter(self.output_format)
+            values = xi_values if exporter.isIntegerFormat() else ri_values
+            if values is None:
+                raise ValueError(f"The '{self.output_format}' format is only available for methods with Xi values.")
+
+        if self.output_compression is not None:
+            exporter = CompressedExporter(exporter, self.output_compression)
+
+        values = np.asarray(values)
+
+        def chunks():
+            for start in range(0, len(values), self.chunk_size):
+                if worker is not None:
+                    if worker.isCancelled():
+                        return
+                    worker.reportProgress(len(values) + start, 2 * len(values))
+                yield values[start:start + self.chunk_size]
+
+        # Define la ruta para el archivo de salida y escribe los números generados, formateándolos por bloques
+        self.file_path = os.path.join(self.output_dir, base_name + exporter.getExtension())
+        if isinstance(exporter, TextExporter):
+            exporter.writeChunks(self.file_path, chunks())
+        elif isinstance(exporter, CompressedExporter):
+            exporter.writeChunks(self.file_path, chunks(), parameters)
+        else:
+            exporter.writeChunks(self.file_path, chunks(), len(values), parameters)
+
+        # Si se canceló durante la escritura, borra el archivo incompleto y su encabezado
+        if worker is not None and worker.isCancelled():
+            inner = exporter.exporter if isinstance(exporter, CompressedExporter) else exporter
+            paths = [self.file_path]
+            if isinstance(inner, BinaryExporter):
+                paths.append(inner.getHeaderPath(self.file_path))
+            for path in paths:
+                if os.path.exists(path):
+                    os.remove(path)
+
     def manage_tab1_info(self):
         """
             Este método gestiona la información de la pestaña 1 de la ventana principal MainFrame.
@@ -64,21 +294,28 @@ class Presenter:
             QMessageBox.critical(self.main_frame, "Error", "You cannot leave blank spaces.")
             return
 
-        # Crea un objeto MiddleSquareMethod y genera números pseudoaleatorios
+        # Crea un objeto MiddleSquareMethod
         msm = MiddleSquareMethod(seed, min_value, max_value, iterations)
-        msm.generateRandoms()
 
-        # Muestra los números generados en una tabla en la pestaña 1
-        self.main_frame.tab1.set_data(msm.get_xi_values_array(), msm.get_ri_values_array(), msm.get_ni_values_array())
-        self.main_frame.tab1.generateTable()
+        # Crea el acumulador de estadísticas de Ri de esta generación
+        statistics = StreamingStatistics()
 
-        # Define la ruta para el archivo de salida
-        self.file_path = os.path.join(self.output_dir, 'MiddleSquareValues.txt')
+        def task(worker):
+            # Genera números pseudoaleatorios por bloques, informando el avance y atendiendo la cancelación; al
+            # repetirse una semilla, los bloques siguientes se toman del ciclo detectado
+            values = self.collect_chunks(worker, msm.iter_chunks(self.chunk_size, statistics), 2 * iterations, 3)
+            if values is None:
+                return None
+            xi_values, ri_values, ni_values = values
 
-        # Escribe los números generados en un archivo de texto
-        with open(self.file_path, 'w') as f:
-            for value in msm.get_ri_values_array():
-                f.write(str(value) + '\n')
+            # Escribe los números generados en el directorio de salida
+            self.export_values('MiddleSquareValues', ri_values, xi_values,
+                               {'method': 'MiddleSquareMethod', 'seed': seed, 'min': min_value, 'max': max_value,
+                                'iterations': iterations}, worker)
+            return xi_values, ri_values, ni_values
+
+        # Genera los números en segundo plano y los muestra en una tabla en la pestaña 1 al terminar
+        self.start_worker(task, self.main_frame.tab1, statistics=statistics)
 
     def manage_tab2_info(self):
         """
@@ -119,23 +356,32 @@ class Presenter:
                                  "The minimum value cannot be greater than the maximum value.")
             return
 
-        # Crea un objeto LinearCongruentialMethod y genera números pseudoaleatorios
+        # Crea un objeto LinearCongruentialMethod
         lcm = LinearCongruentialMethod(xo_param, k_param, c_param, g_param, min_value, max_value, iterations)
-        lcm.fillFirstXiValue()
-        lcm.fillXiValues()
-        lcm.fillRiAndNiValues()
 
-        # Muestra los números generados en una tabla en la pestaña 2
-        self.main_frame.tab2.set_data(lcm.get_xi_values_array(), lcm.get_ri_values_array(), lcm.get_ni_values_array())
-        self.main_frame.tab2.generateTable()
+        # Crea el acumulador de estadísticas de Ri, que se actualiza con cada bloque generado
+        statistics = StreamingStatistics()
+
+        def task(worker):
+            # Genera números pseudoaleatorios por bloques, informando el avance y atendiendo la cancelación
+            values = self.collect_chunks(worker, lcm.iter_chunks(self.chunk_size, statistics), 2 * iterations, 3)
+            if values is None:
+                return None
+            xi_values, ri_values, ni_values = values
 
-        # Define la ruta para el archivo de salida
-        self.file_path = os.path.join(self.output_dir, 'LinearCongruentialValues.txt')
+            # Redondea los valores a la precisión de salida, una sola vez para la tabla y el archivo
+            ri_values = self.output_precision.apply(ri_values)
+            ni_values = self.output_precision.apply(ni_values)
 
-        # Escribe los números generados en un archivo de texto
-        with open(self.file_path, 'w') as f:
-            for value in lcm.get_ri_values_array():
-                f.write(str(value) + '\n')
+            # Escribe los números generados en el directorio de salida
+            self.export_values('LinearCongruentialValues', ri_values, xi_values,
+                               {'method': 'LinearCongruentialMethod', 'xo': xo_param, 'k': k_param, 'c': c_param,
+                                'g': g_param, 'min': min_value, 'max': max_value, 'iterations': iterations},
+                               worker)
+            return xi_values, ri_values, ni_values
+
+        # Genera los números en segundo plano y los muestra en una tabla en la pestaña 2 al terminar
+        self.start_worker(task, self.main_frame.tab2, statistics=statistics)
 
     def manage_tab3_info(self):
         """
@@ -170,23 +416,32 @@ class Presenter:
                                  "The minimum value cannot be greater than the maximum value.")
             return
 
-        # Crea un objeto MultiplicativeCongruentialMethod y genera números pseudoaleatorios
+        # Crea un objeto MultiplicativeCongruentialMethod
         mcm = MultiplicativeCongruentialMethod(xo_param, t_param, g_param, min_value, max_value, iterations)
-        mcm.fillFirstXiValue()
-        mcm.fillXiValues()
-        mcm.fillRiAndNiValues()
 
-        # Muestra los números generados en una tabla en la pestaña 3
-        self.main_frame.tab3.set_data(mcm.get_xi_values_array(), mcm.get_ri_values_array(), mcm.get_ni_values_array())
-        self.main_frame.tab3.generateTable()
+        # Crea el acumulador de estadísticas de Ri, que se actualiza con cada bloque generado
+        statistics = StreamingStatistics()
+
+        def task(worker):
+            # Genera números pseudoaleatorios por bloques, informando el avance y atendiendo la cancelación
+            values = self.collect_chunks(worker, mcm.iter_chunks(self.chunk_size, statistics), 2 * iterations, 3)
+            if values is None:
+                return None
+            xi_values, ri_values, ni_values = values
 
-        # Define la ruta para el archivo de salida
-        self.file_path = os.path.join(self.output_dir, 'MultiplicativeCongruentialValues.txt')
+            # Redondea los valores a la precisión de salida, una sola vez para la tabla y el archivo
+            ri_values = self.output_precision.apply(ri_values)
+            ni_values = self.output_precision.apply(ni_values)
 
-        # Escribe los números generados en un archivo de texto
-        with open(self.file_path, 'w') as f:
-            for value in mcm.get_ri_values_array():
-                f.write(str(value) + '\n')
+            # Escribe los números generados en el directorio de salida
+            self.export_values('MultiplicativeCongruentialValues', ri_values, xi_values,
+                               {'method': 'MultiplicativeCongruentialMethod', 'xo': xo_param, 't': t_param,
+                                'g': g_param, 'min': min_value, 'max': max_value, 'iterations': iterations},
+                               worker)
+            return xi_values, ri_values, ni_values
+
+        # Genera los números en segundo plano y los muestra en una tabla en la pestaña 3 al terminar
+        self.start_worker(task, self.main_frame.tab3, statistics=statistics)
 
     def manage_tab4_info(self):
         """
@@ -212,22 +467,31 @@ class Presenter:
             QMessageBox.critical(self.main_frame, "Error", "You cannot leave blank spaces.")
             return
 
-        # Crea un objeto UniformDistributionMethod y genera números pseudoaleatorios
+        # Crea un objeto UniformDistributionMethod
         udm = UniformDistributionMethod(min_value, max_value, iterations)
-        udm.fillRiValues()
-        udm.fillNiValues()
 
-        # Muestra los números generados en una tabla en la pestaña 4
-        self.main_frame.tab4.set_data(udm.get_ri_values_array(), udm.get_ni_values_array())
-        self.main_frame.tab4.generateTable()
+        # Crea el acumulador de estadísticas de Ri, que se actualiza con cada bloque generado
+        statistics = StreamingStatistics()
+
+        def task(worker):
+            # Genera números pseudoaleatorios por bloques, informando el avance y atendiendo la cancelación
+            values = self.collect_chunks(worker, udm.iter_chunks(self.chunk_size, statistics), 2 * iterations, 2)
+            if values is None:
+                return None
 
-        # Define la ruta para el archivo de salida
-        self.file_path = os.path.join(self.output_dir, 'UniformDistributionValues.txt')
+            # Redondea los valores a la precisión de salida, una sola vez para la tabla y el archivo
+            ri_values = self.output_precision.apply(values[0])
+            ni_values = self.output_precision.apply(values[1])
 
-        # Escribe los números generados en un archivo de texto
-        with open(self.file_path, 'w') as f:
-            for value in udm.get_ri_values_array():
-                f.write(str(value) + '\n')
+            # Escribe los números generados en el directorio de salida
+            self.export_values('UniformDistributionValues', ri_values,
+                               parameters={'method': 'UniformDistributionMethod', 'seed': udm.random_source.getSeed(),
+                                           'min': min_value, 'max': max_value, 'iterations': iterations},
+                               worker=worker)
+            return ri_values, ni_values
+
+        # Genera los números en segundo plano y los muestra en una tabla en la pestaña 4 al terminar
+        self.start_worker(task, self.main_frame.tab4, 'UniformDistributionHistogram', statistics=statistics)
 
     def manage_tab5_info(self):
         """
@@ -254,25 +518,31 @@ class Presenter:
             QMessageBox.critical(self.main_frame, "Error", "You cannot leave blank spaces.")
             return
 
-        # Crear un objeto NormalInvDistributionMethod y genera números pseudoaleatorios
+        # Crear un objeto NormalInvDistributionMethod
         nidm = NormalInvDistributionMethod(xi_amount, min_value, max_value, iterations)
-        nidm.fillRandomValues1()
-        nidm.fillRandomValues2()
-        nidm.fillXiValues()
-        nidm.fillRiValues()
-        nidm.fillNiValues()
-
-        # Muestra los números generados en una tabla en la pestaña 5
-        self.main_frame.tab5.set_data(nidm.get_ri_values_array(), nidm.get_ni_values_array())
-        self.main_frame.tab5.generateTable()
-
-        # Define la ruta para el archivo de salida
-        self.file_path = os.path.join(self.output_dir, 'InverseNormalDistributionValues.txt')
-
-        # Escribe los números generados en un archivo de texto
-        with open(self.file_path, 'w') as f:
-            for value in nidm.get_ri_values_array():
-                f.write(str(value) + '\n')
+
+        # Crea el acumulador de estadísticas de Ri, que se actualiza con cada bloque generado
+        statistics = StreamingStatistics()
+
+        def task(worker):
+            # Genera números pseudoaleatorios por bloques, informando el avance y atendiendo la cancelación
+            values = self.collect_chunks(worker, nidm.iter_chunks(self.chunk_size, statistics), 2 * iterations, 2)
+            if values is None:
+                return None
+
+            # Redondea los valores a la precisión de salida, una sola vez para la tabla y el archivo
+            ri_values = self.output_precision.apply(values[0])
+            ni_values = self.output_precision.apply(values[1])
+
+            # Escribe los números generados en el directorio de salida
+            self.export_values('InverseNormalDistributionValues', ri_values,
+                               parameters={'method': 'NormalInvDistributionMethod', 'seed': nidm.random_source.getSeed(),
+                                           'xi_amount': xi_amount, 'min': min_value, 'max': max_value,
+                                           'iterations': iterations}, worker=worker)
+            return ri_values, ni_values
+
+        # Genera los números en segundo plano y los muestra en una tabla en la pestaña 5 al terminar
+        self.start_worker(task, self.main_frame.tab5, 'InverseNormalDistributionHistogram', statistics=statistics)
 
 if __name__ == "__main__":
     """
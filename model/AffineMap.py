@@ -0,0 +1,148 @@
+import numpy as np
+
+class AffineMap:
+    """
+        Esta clase representa la transformación afín x -> (a * x + c) mod 2^g que define a los métodos congruenciales.
+        Permite componer la transformación consigo misma para avanzar bloques completos de la secuencia en una sola
+        operación vectorial.
+    """
+
+    __slots__ = ('g', 'modulus', 'a', 'c')
+
+    def __init__(self, a, c, g):
+        """
+            Este es el método constructor de la clase AffineMap.
+            Inicializa la transformación con el multiplicador, el incremento y el parámetro del módulo dados.
+        """
+        self.g = g  # Parametro del modulo
+        self.modulus = 2 ** g  # Modulo de la transformacion
+        self.a = a % self.modulus  # Multiplicador reducido al modulo
+        self.c = c % self.modulus  # Incremento reducido al modulo
+
+    def usesNativeIntegers(self):
+        """
+            Este método indica si la aritmética de la transformación cabe en enteros uint64 nativos.
+            Como 2^g divide a 2^64 cuando g <= 64, el desbordamiento de uint64 no altera el resultado módulo 2^g.
+        """
+        return self.g <= 64
+
+    def getDtype(self):
+        """
+            Este método devuelve el tipo de dato NumPy con el que se almacenan los valores de la secuencia.
+        """
+        return np.uint64 if self.usesNativeIntegers() else object
+
+    def apply(self, x):
+        """
+            Este método aplica la transformación a un valor entero.
+        """
+        return (self.a * x + self.c) % self.modulus
+
+    def compose(self, other):
+        """
+            Este método devuelve la transformación que resulta de aplicar primero 'other' y luego esta transformación.
+        """
+        return AffineMap(self.a * other.a, self.a * other.c + self.c, self.g)
+
+    def power(self, n):
+        """
+            Este método devuelve la transformación aplicada n veces, calculada por exponenciación binaria en O(log n).
+            Equivale a a^n y c * (a^n - 1) / (a - 1) módulo 2^g, sin necesidad de dividir por (a - 1).
+        """
+        if n < 0:
+            raise ValueError("The number of steps cannot be negative.")
+
+        result = AffineMap(1, 0, self.g)
+        base = self
+        while n > 0:
+            if n & 1:
+                result = base.compose(result)
+            base = base.compose(base)
+            n >>= 1
+        return result
+
+    def jump(self, x, n):
+        """
+            Este método devuelve el valor que se obtiene al aplicar la transformación n veces a x, en O(log n).
+        """
+        return self.power(n).apply(x)
+
+    def generateSlice(self, x, start, stop, step=1, block_size=65536):
+        """
+            Este método devuelve los valores F^(i + 1)(x) para i en range(start, stop, step) sin generar los anteriores.
+            Salta directamente al primer índice y avanza los siguientes con la transformación F^step.
+        """
+        if start < 0 or step <= 0:
+            raise ValueError("Slices must have a non-negative start and a positive step.")
+
+        count = len(range(start, stop, step))
+        values = np.empty(count, dtype=self.getDtype())
+        if count == 0:
+            return values
+
+        first = self.jump(x, start + 1)
+        values[0] = first
+        values[1:] = self.power(step).generate(first, count - 1, block_size)
+        return values
+
+    def blockCoefficients(self, size):
+        """
+            Este método calcula los coeficientes (A_k, C_k) de las transformaciones F^1, ..., F^size.
+            Se obtienen por duplicación: F^(s + k) = F^s o F^k, de modo que cada paso procesa medio bloque a la vez.
+        """
+        dtype = self.getDtype()
+        multipliers = np.empty(size, dtype=dtype)
+        increments = np.empty(size, dtype=dtype)
+        if size == 0:
+            return multipliers, increments
+
+        multipliers[0] = self.a
+        increments[0] = self.c
+        filled = 1
+        while filled < size:
+            step = min(filled, size - filled)
+            a_s = multipliers[filled - 1]
+            c_s = increments[filled - 1]
+            multipliers[filled:filled + step] = self._reduce(multipliers[:step] * a_s)
+            increments[filled:filled + step] = self._reduce(increments[:step] * a_s + c_s)
+            filled += step
+        return multipliers, increments
+
+    def generateBlocks(self, x, count, block_size=65536):
+        """
+            Este método genera los 'count' valores siguientes a x, es decir F^1(x), ..., F^count(x),
+            en bloques de como máximo 'block_size' valores. Cada bloque se calcula con una sola operación vectorial.
+        """
+        block_size = max(1, min(block_size, count))
+        multipliers, increments = self.blockCoefficients(block_size)
+        dtype = self.getDtype()
+        state = x % self.modulus
+        produced = 0
+        while produced < count:
+            size = min(block_size, count - produced)
+            start = np.array(state, dtype=dtype)
+            block = self._reduce(multipliers[:size] * start + increments[:size])
+            state = int(block[-1])
+            produced += size
+            yield block
+
+    def generate(self, x, count, block_size=65536):
+        """
+            Este método devuelve en un único arreglo los 'count' valores siguientes a x.
+        """
+        values = np.empty(count, dtype=self.getDtype())
+        position = 0
+        for block in self.generateBlocks(x, count, block_size):
+            values[position:position + len(block)] = block
+            position += len(block)
+        return values
+
+    def _reduce(self, values):
+        """
+            Este método reduce un arreglo de valores al módulo de la transformación.
+        """
+        if self.usesNativeIntegers():
+            if self.g == 64:
+                return values
+            return values & np.uint64(self.modulus - 1)
+        return values % self.modulus
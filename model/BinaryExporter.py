@@ -0,0 +1,135 @@
+import json
+import os
+
+import numpy as np
+
+class BinaryExporter:
+    """
+        Esta clase escribe los valores generados en formatos binarios compactos, directamente desde los arreglos y en
+        pocas llamadas de escritura grandes. Los formatos disponibles son:
+            'f64' / 'f32': flotantes crudos little-endian de 64 o 32 bits (valores Ri o Ni).
+            'npy': archivo .npy de NumPy con flotantes de 64 bits, escrito mediante un mapa de memoria.
+            'u32' / 'u64': enteros sin signo empaquetados de 32 o 64 bits (valores Xi).
+        Opcionalmente escribe junto al archivo un encabezado JSON con los parámetros de la generación.
+    """
+
+    FORMATS = {
+        'f64': ('<f8', '.f64'),
+        'f32': ('<f4', '.f32'),
+        'npy': ('<f8', '.npy'),
+        'u32': ('<u4', '.u32'),
+        'u64': ('<u8', '.u64'),
+    }
+
+    __slots__ = ('format', 'write_header', 'chunk_size')
+
+    def __init__(self, format='f64', write_header=True, chunk_size=1 << 20):
+        """
+            Este es el método constructor de la clase BinaryExporter.
+            Recibe el formato de salida, si se escribe el encabezado JSON y el tamaño de los bloques de escritura.
+        """
+        if format not in self.FORMATS:
+            raise ValueError(f"Unknown binary format: {format}. Available: {', '.join(self.FORMATS)}.")
+
+        self.format = format  # Formato de salida
+        self.write_header = write_header  # Indica si se escribe el encabezado JSON
+        self.chunk_size = chunk_size  # Cantidad de valores por escritura
+
+    def getDtype(self):
+        """
+            Este método devuelve el tipo de dato NumPy, con orden de bytes explícito, del formato.
+        """
+        return np.dtype(self.FORMATS[self.format][0])
+
+    def getExtension(self):
+        """
+            Este método devuelve la extensión de archivo del formato.
+        """
+        return self.FORMATS[self.format][1]
+
+    def isIntegerFormat(self):
+        """
+            Este método indica si el formato almacena enteros (valores Xi) en lugar de flotantes.
+        """
+        return self.getDtype().kind == 'u'
+
+    def getHeaderPath(self, path):
+        """
+            Este método devuelve la ruta del encabezado JSON asociado a un archivo.
+        """
+        return path + '.json'
+
+    def write(self, path, values, parameters=None):
+        """
+            Este método escribe un arreglo completo de valores, o una vista con iter_chunks, en el archivo 'path'.
+        """
+        if hasattr(values, 'iter_chunks'):
+            chunks = values.iter_chunks(self.chunk_size)
+        else:
+            values = np.asarray(values)
+            chunks = (values[start:start + self.chunk_size] for start in range(0, len(values), self.chunk_size))
+        return self.writeChunks(path, chunks, len(values), parameters)
+
+    def writeChunks(self, path, chunks, count=None, parameters=None):
+        """
+            Este método escribe una secuencia de bloques de valores en el archivo 'path' y devuelve cuántos escribió.
+            El formato 'npy' necesita conocer de antemano la cantidad total de valores ('count').
+        """
+        dtype = self.getDtype()
+        written = 0
+        if self.format == 'npy':
+            if count is None:
+                raise ValueError("The 'npy' format needs the total number of values in advance.")
+            output = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(count,))
+            for chunk in chunks:
+                output[written:written + len(chunk)] = self.convertChunk(chunk)
+                written += len(chunk)
+            output.flush()
+            del output
+        else:
+            with open(path, 'wb') as f:
+                for chunk in chunks:
+                    chunk = self.convertChunk(chunk)
+                    f.write(memoryview(chunk))
+                    written += len(chunk)
+
+        if self.write_header:
+            self.writeHeader(path, written, parameters)
+        return written
+
+    def convertChunk(self, chunk):
+        """
+            Este método convierte un bloque al tipo de dato del formato, verificando que los enteros quepan en él.
+        """
+        dtype = self.getDtype()
+        if self.isIntegerFormat():
+            chunk = np.asarray(chunk)
+            if chunk.dtype.kind not in 'ui' and chunk.dtype != object:
+                raise ValueError(f"The '{self.format}' format only stores integer Xi values.")
+            if len(chunk) and (chunk.min() < 0 or chunk.max() > np.iinfo(dtype).max):
+                raise ValueError(f"The values do not fit in the '{self.format}' format.")
+        return np.ascontiguousarray(chunk, dtype=dtype)
+
+    def writeHeader(self, path, count, parameters=None):
+        """
+            Este método escribe el encabezado JSON con el formato, el tipo de dato, la cantidad de valores y los
+            parámetros de la generación.
+        """
+        header = {
+            'format': self.format,
+            'dtype': self.getDtype().str,
+            'count': count,
+            'parameters': parameters or {},
+        }
+        with open(self.getHeaderPath(path), 'w') as f:
+            json.dump(header, f, indent=4, default=str)
+
+    def read(self, path):
+        """
+            Este método lee un archivo escrito con este formato como un arreglo mapeado en memoria, sin copiarlo.
+        """
+        if self.format == 'npy':
+            return np.load(path, mmap_mode='r')
+        if os.path.getsize(path) == 0:
+            return np.empty(0, dtype=self.getDtype())
+        return np.memmap(path, dtype=self.getDtype(), mode='r')
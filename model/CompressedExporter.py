@@ -0,0 +1,146 @@
+import bz2
+import gzip
+import lzma
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from model.ParallelBlocks import resolveWorkers
+from model.TextExporter import TextExporter
+
+class CompressedExporter:
+    """
+        Esta clase escribe los valores generados en archivos comprimidos con gzip, bz2 o xz, usando solo la biblioteca
+        estándar. Envuelve un TextExporter o un BinaryExporter, que define cómo se convierte cada bloque en bytes.
+        Cada bloque se comprime de forma independiente y en paralelo en un conjunto de hilos (los compresores liberan
+        el GIL), y los resultados se escriben en orden como miembros consecutivos de un mismo flujo, que los lectores
+        estándar (gzip, bzip2, xz) descomprimen como un único archivo.
+    """
+
+    COMPRESSIONS = {
+        'gzip': (gzip.compress, gzip.open, '.gz'),
+        'bz2': (bz2.compress, bz2.open, '.bz2'),
+        'xz': (lzma.compress, lzma.open, '.xz'),
+    }
+
+    __slots__ = ('exporter', 'compression', 'level', 'workers', 'chunk_size')
+
+    def __init__(self, exporter=None, compression='gzip', level=None, workers=None, chunk_size=1 << 20):
+        """
+            Este es el método constructor de la clase CompressedExporter.
+            Recibe el exportador que formatea los bloques (por defecto un TextExporter), el tipo de compresión, el
+            nivel de compresión (None para el nivel por defecto), el número de hilos y la cantidad de valores por bloque.
+        """
+        if compression not in self.COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compression}. Available: {', '.join(self.COMPRESSIONS)}.")
+
+        exporter = exporter if exporter is not None else TextExporter()
+        if getattr(exporter, 'format', None) == 'npy':
+            raise ValueError("The 'npy' format cannot be compressed; use 'f64' instead.")
+
+        self.exporter = exporter  # Exportador que convierte cada bloque en bytes
+        self.compression = compression  # Tipo de compresion
+        self.level = level  # Nivel de compresion, o None para el nivel por defecto
+        self.workers = resolveWorkers(workers)  # Numero de hilos de compresion
+        self.chunk_size = chunk_size  # Cantidad de valores por bloque comprimido
+
+    def getExtension(self):
+        """
+            Este método devuelve la extensión de archivo: la del exportador seguida de la de la compresión.
+        """
+        return self.exporter.getExtension() + self.COMPRESSIONS[self.compression][2]
+
+    def isText(self):
+        """
+            Este método indica si el contenido comprimido es texto (TextExporter) en lugar de binario.
+        """
+        return isinstance(self.exporter, TextExporter)
+
+    def encodeChunk(self, chunk):
+        """
+            Este método convierte un bloque de valores en los bytes que se van a comprimir.
+        """
+        if self.isText():
+            return self.exporter.formatChunk(chunk).encode('ascii')
+        return self.exporter.convertChunk(chunk).tobytes()
+
+    def compressChunk(self, chunk):
+        """
+            Este método convierte y comprime un bloque, produciendo un miembro completo del flujo comprimido.
+        """
+        compress = self.COMPRESSIONS[self.compression][0]
+        data = self.encodeChunk(chunk)
+        if self.level is None:
+            return compress(data)
+        if self.compression == 'xz':
+            return compress(data, preset=self.level)
+        return compress(data, self.level)
+
+    def write(self, path, values, parameters=None):
+        """
+            Este método escribe un arreglo completo de valores, o una vista con iter_chunks, en el archivo 'path'.
+        """
+        if hasattr(values, 'iter_chunks'):
+            chunks = values.iter_chunks(self.chunk_size)
+        else:
+            values = np.asarray(values)
+            chunks = (values[start:start + self.chunk_size] for start in range(0, len(values), self.chunk_size))
+        return self.writeChunks(path, chunks, parameters)
+
+    def compressChunks(self, chunks):
+        """
+            Este método comprime en paralelo una secuencia de bloques y devuelve, en orden, tuplas (cantidad, miembro)
+            con la cantidad de valores del bloque y su miembro comprimido. Solo se mantienen en memoria unos pocos
+            bloques por hilo, por lo que la secuencia puede ser arbitrariamente larga.
+        """
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for chunk in chunks:
+                pending.append((len(chunk), executor.submit(self.compressChunk, chunk)))
+                # Limita la cantidad de bloques en vuelo, entregando los más antiguos a medida que terminan
+                if len(pending) >= 2 * self.workers:
+                    count, future = pending.popleft()
+                    yield count, future.result()
+            while pending:
+                count, future = pending.popleft()
+                yield count, future.result()
+
+    def writeChunks(self, path, chunks, parameters=None):
+        """
+            Este método comprime en paralelo una secuencia de bloques y la escribe, en orden, en el archivo 'path'.
+            Devuelve la cantidad de valores escritos.
+        """
+        written = 0
+        with open(path, 'wb') as f:
+            for count, member in self.compressChunks(chunks):
+                f.write(member)
+                written += count
+
+        if not self.isText() and self.exporter.write_header:
+            self.exporter.writeHeader(path, written, parameters)
+        return written
+
+    def readChunks(self, path, chunk_size=None):
+        """
+            Este método descomprime el archivo 'path' como flujo y devuelve sus valores por bloques NumPy.
+        """
+        chunk_size = chunk_size or self.chunk_size
+        opener = self.COMPRESSIONS[self.compression][1]
+        if self.isText():
+            # Cada línea ocupa al menos dos caracteres, por lo que se leen bloques de tamaño aproximado en bytes
+            with opener(path, 'rt') as f:
+                while True:
+                    lines = f.readlines(chunk_size * 8)
+                    if not lines:
+                        break
+                    yield np.array(lines, dtype=np.float64)
+            return
+
+        dtype = self.exporter.getDtype()
+        with opener(path, 'rb') as f:
+            while True:
+                data = f.read(chunk_size * dtype.itemsize)
+                if not data:
+                    break
+                yield np.frombuffer(data, dtype=dtype)
@@ -0,0 +1,84 @@
+import numpy as np
+
+class Histogram:
+    """
+        Esta clase calcula el histograma de una secuencia de valores con intervalos de igual ancho y bordes fijos.
+        El intervalo de cada valor se obtiene aritméticamente y las frecuencias se cuentan con np.bincount, sin buscar
+        en los bordes; el resultado es idéntico al de np.histogram. Como los bordes son fijos, los valores pueden
+        agregarse por bloques.
+    """
+
+    # Cantidad de valores procesados por bloque, para que los arreglos temporales quepan en la caché
+    BLOCK_SIZE = 65536
+
+    __slots__ = ('bins', 'low', 'high', 'counts')
+
+    def __init__(self, bins, low, high):
+        """
+            Este es el método constructor de la clase Histogram.
+            Recibe la cantidad de intervalos y los bordes inferior y superior del rango; el último intervalo incluye
+            el borde superior y los valores fuera del rango no se cuentan.
+        """
+        if bins <= 0:
+            raise ValueError("The number of bins must be positive.")
+        if not low < high:
+            raise ValueError("The lower edge must be less than the upper edge.")
+
+        self.bins = bins  # Cantidad de intervalos
+        self.low = float(low)  # Borde inferior del rango
+        self.high = float(high)  # Borde superior del rango
+        self.counts = np.zeros(bins, dtype=np.int64)  # Frecuencia de cada intervalo
+
+    @classmethod
+    def fromValues(cls, values, bins):
+        """
+            Este método crea el histograma de 'values' sobre el rango entre su mínimo y su máximo, igual que
+            np.histogram sin rango explícito.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        low, high = (float(values.min()), float(values.max())) if len(values) else (0.0, 1.0)
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+        histogram = cls(bins, low, high)
+        histogram.add(values)
+        return histogram
+
+    def getEdges(self):
+        """
+            Este método devuelve los bordes de los intervalos, bins + 1 valores.
+        """
+        return np.linspace(self.low, self.high, self.bins + 1)
+
+    def getCounts(self):
+        """
+            Este método devuelve las frecuencias acumuladas de cada intervalo.
+        """
+        return self.counts
+
+    def binIndices(self, values):
+        """
+            Este método devuelve el intervalo de cada valor dentro del rango, descartando los que están fuera de él.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        inside = (values >= self.low) & (values <= self.high)
+        if not inside.all():
+            values = values[inside]
+        edges = self.getEdges()
+
+        index = ((values - self.low) * (self.bins / (self.high - self.low))).astype(np.intp)
+        index[index == self.bins] -= 1
+
+        # Corrige los valores que el redondeo dejó en el intervalo vecino, comparándolos con los bordes
+        index[values < edges[index]] -= 1
+        index[(values >= edges[index + 1]) & (index != self.bins - 1)] += 1
+        return index
+
+    def add(self, values):
+        """
+            Este método agrega valores a las frecuencias del histograma, procesándolos por bloques.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        for start in range(0, len(values), self.BLOCK_SIZE):
+            index = self.binIndices(values[start:start + self.BLOCK_SIZE])
+            self.counts += np.bincount(index, minlength=self.bins)
+        return self
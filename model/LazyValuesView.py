@@ -0,0 +1,57 @@
+class LazyValuesView:
+    """
+        Esta clase representa una secuencia de valores derivados (por ejemplo Ri o Ni) que no se almacena: cada valor
+        se calcula a partir del arreglo fuente (los Xi) solo cuando se pide, por índice, por rebanada o por bloques.
+    """
+
+    __slots__ = ('source', 'transform', 'chunk_size')
+
+    def __init__(self, source, transform, chunk_size=65536):
+        """
+            Este es el método constructor de la clase LazyValuesView.
+            Recibe el arreglo fuente y la función vectorial que convierte un bloque de la fuente en valores derivados.
+        """
+        self.source = source  # Arreglo del que se derivan los valores
+        self.transform = transform  # Funcion que calcula un bloque de valores a partir de un bloque de la fuente
+        self.chunk_size = chunk_size  # Tamaño de bloque usado al recorrer la vista completa
+
+    def __len__(self):
+        """
+            Este método devuelve la cantidad de valores de la vista.
+        """
+        return len(self.source)
+
+    def __getitem__(self, index):
+        """
+            Este método calcula el valor de una posición, o el arreglo de valores de una rebanada.
+        """
+        if isinstance(index, slice):
+            return self.transform(self.source[index])
+
+        if index < 0:
+            index += len(self.source)
+        if not 0 <= index < len(self.source):
+            raise IndexError("The index is out of range.")
+        return self.transform(self.source[index:index + 1])[0]
+
+    def iter_chunks(self, chunk_size=None):
+        """
+            Este método recorre los valores en bloques de 'chunk_size', calculando cada bloque solo cuando se pide.
+        """
+        chunk_size = chunk_size or self.chunk_size
+        for start in range(0, len(self.source), chunk_size):
+            yield self.transform(self.source[start:start + chunk_size])
+
+    def __iter__(self):
+        """
+            Este método recorre los valores uno a uno, calculándolos por bloques.
+        """
+        for chunk in self.iter_chunks():
+            yield from chunk
+
+    def __array__(self, dtype=None, copy=None):
+        """
+            Este método materializa la vista completa como arreglo NumPy, p. ej. al llamar a np.asarray.
+        """
+        values = self.transform(self.source)
+        return values if dtype is None else values.astype(dtype)
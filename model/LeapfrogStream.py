@@ -0,0 +1,101 @@
+import numpy as np
+
+
+class LeapfrogStream:
+    """
+        Esta clase representa una subsecuencia 'leapfrog' de un método congruencial: el trabajador j de P recibe los
+        elementos j, j + P, j + 2P, ... de la secuencia original. Cada subsecuencia es un generador independiente que
+        avanza con la transformación F^P, de modo que no requiere coordinación con las demás.
+    """
+
+    __slots__ = ('xi_values', 'ri_values', 'ni_values', 'step_map', 'first', 'state', 'min', 'max', 'iterations')
+
+    def __init__(self, step_map, first, min, max, iterations):
+        """
+            Este es el método constructor de la clase LeapfrogStream.
+            Recibe la transformación F^P, el primer valor Xi de la subsecuencia, el rango de Ni y el número de valores.
+        """
+        self.xi_values = np.empty(0, dtype=step_map.getDtype())  # Arreglo para almacenar los valores de Xi
+        self.ri_values = np.empty(0, dtype=np.float64)  # Arreglo para almacenar los valores de Ri
+        self.ni_values = np.empty(0, dtype=np.float64)  # Arreglo para almacenar los valores de Ni
+        self.step_map = step_map  # Transformacion F^P que avanza la subsecuencia
+        self.first = first  # Primer valor Xi de la subsecuencia
+        self.state = None  # Ultimo valor Xi entregado por next()
+        self.min = min  # Valor minimo para el rango
+        self.max = max  # Valor maximo para el rango
+        self.iterations = iterations  # Numero de valores de la subsecuencia
+
+    def getMultiplier(self):
+        """
+            Este método devuelve el multiplicador a^P de la subsecuencia.
+        """
+        return self.step_map.a
+
+    def getIncrement(self):
+        """
+            Este método devuelve el incremento c * (a^P - 1) / (a - 1) mod 2^g de la subsecuencia.
+        """
+        return self.step_map.c
+
+    def __iter__(self):
+        """
+            Este método permite recorrer la subsecuencia con un ciclo for.
+        """
+        return self
+
+    def __next__(self):
+        """
+            Este método devuelve el siguiente valor Xi de la subsecuencia con un único paso O(1).
+            La subsecuencia no tiene fin; el número de iteraciones solo limita los métodos de llenado.
+        """
+        self.state = self.first if self.state is None else self.step_map.apply(self.state)
+        return self.state
+
+    def computeRiAndNiBlock(self, xi_block):
+        """
+            Este método calcula los valores de Ri y Ni de un bloque de valores Xi con operaciones vectoriales.
+            Los valores se conservan con precisión completa; el redondeo se aplica solo al mostrarlos o exportarlos.
+        """
+        ri_block = xi_block.astype(np.float64) / (self.step_map.modulus - 1)
+        ni_block = self.min + (self.max - self.min) * ri_block
+        return ri_block, ni_block
+
+    def generateBlocks(self, block_size=65536):
+        """
+            Este método genera los valores de Xi, Ri y Ni de la subsecuencia como arreglos NumPy, por bloques.
+        """
+        if self.iterations == 0:
+            return
+
+        first_block = np.array([self.first], dtype=self.step_map.getDtype())
+        yield (first_block,) + self.computeRiAndNiBlock(first_block)
+        for xi_block in self.step_map.generateBlocks(self.first, self.iterations - 1, block_size):
+            yield (xi_block,) + self.computeRiAndNiBlock(xi_block)
+
+    def fillValuesBatch(self, block_size=65536):
+        """
+            Este método calcula y almacena todos los valores de Xi, Ri y Ni de la subsecuencia como arreglos NumPy.
+        """
+        self.xi_values = np.empty(self.iterations, dtype=self.step_map.getDtype())
+        if self.iterations > 0:
+            self.xi_values[0] = self.first
+            self.xi_values[1:] = self.step_map.generate(self.first, self.iterations - 1, block_size)
+        self.ri_values, self.ni_values = self.computeRiAndNiBlock(self.xi_values)
+
+    def get_xi_values_array(self):
+        """
+            Este método devuelve el arreglo de valores Xi.
+        """
+        return self.xi_values
+
+    def get_ri_values_array(self):
+        """
+            Este método devuelve el arreglo de valores Ri.
+        """
+        return self.ri_values
+
+    def get_ni_values_array(self):
+        """
+            Este método devuelve el arreglo de valores Ni.
+        """
+        return self.ni_values
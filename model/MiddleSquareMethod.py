@@ -1,38 +1,227 @@
+import numpy as np
+
+from model.LazyValuesView import LazyValuesView
+
 class MiddleSquareMethod:
     """
         Esta clase implementa el método del cuadrado medio para generar números pseudoaleatorios.
     """
 
-    def __init__(self, seed, min, max, numAmount):
+    __slots__ = ('seed', 'states', 'xiValues', 'centers', 'riValues', 'niValues', 'min', 'max', 'numAmount',
+                 'tail_length', 'cycle_length', 'lazy')
+
+    def __init__(self, seed, min, max, numAmount, lazy=False):
         """
             Este es el método constructor de la clase MiddleSquareMethod.
             Inicializa la clase con los parámetros dados.
+            Si 'lazy' es True solo se almacenan las semillas; Ri y Ni se calculan a partir de ellas cuando se piden.
         """
         self.seed = seed  # Valor inicial de la semilla
-        self.niValues = []  # Lista para almacenar los valores de Xi
-        self.riValues = []  # Lista para almacenar los valores de Ri
-        self.xiValues = []  # Lista para almacenar los valores de Ni
-        self.centers = []  # Lista para almacenar los valores centrales
+        self.states = np.empty(0, dtype=np.int64)  # Arreglo con las semillas sucesivas; Xi y los centros son vistas de el
+        self.xiValues = self.states  # Arreglo para almacenar los valores de Xi
+        self.centers = self.states  # Arreglo para almacenar los valores centrales
+        self.riValues = np.empty(0, dtype=np.float64)  # Arreglo para almacenar los valores de Ri
+        self.niValues = np.empty(0, dtype=np.float64)  # Arreglo para almacenar los valores de Ni
         self.min = min  # Valor Ni minimo
         self.max = max  # Valor Ni maximo
         self.numAmount = numAmount  # Numero de numeros pseudoaleatorios a generar
+        self.tail_length = None  # Cantidad de valores antes de entrar al ciclo, si se detecto uno
+        self.cycle_length = None  # Longitud del ciclo detectado, si se detecto uno
+        self.lazy = lazy  # Indica si Ri y Ni se calculan bajo demanda en lugar de almacenarse
 
-    def generateRandoms(self):
+    def generateRandoms(self, statistics=None):
         """
             Este método genera números pseudoaleatorios utilizando el método del cuadrado medio.
+            Los dígitos centrales se extraen con aritmética entera, sin convertir cada cuadrado a texto.
+            Si la secuencia vuelve a una semilla ya vista, se registra la cola y el ciclo y el resto de los valores
+            se completa repitiendo el ciclo, en lugar de recalcularlo.
+            Si se recibe un StreamingStatistics, los Ri se acumulan en él por bloques a medida que se calculan.
+        """
+        seed = self.seed
+        len_seed = len(str(self.seed))
+        low_power, high_power = self.getCenterPowers(len_seed)
+        states = self.allocateStates(len_seed)
+        self.tail_length = None
+        self.cycle_length = None
+        seen = {}  # Posicion en la que aparecio cada semilla
+        for i in range(self.numAmount):
+            if seed in seen:
+                self.tail_length = seen[seed]
+                self.cycle_length = i - seen[seed]
+                self.tileCycle(i)
+                break
+            seen[seed] = i
+            states[i] = seed
+            seed = (seed * seed) // low_power % high_power
+        else:
+            states[self.numAmount] = seed
+
+        self.fillRiAndNiValues(len_seed, statistics)
+
+    def allocateStates(self, len_seed):
+        """
+            Este método reserva el arreglo de semillas sucesivas, con numAmount + 1 posiciones.
+            Los valores Xi son las primeras numAmount y los centros las últimas numAmount, sin copiar datos.
+        """
+        dtype = np.int64 if len_seed <= 9 else object
+        self.states = np.empty(self.numAmount + 1, dtype=dtype)
+        self.xiValues = self.states[:self.numAmount]
+        self.centers = self.states[1:]
+        return self.states
+
+    def fillRiAndNiValues(self, len_seed, statistics=None, block_size=65536):
+        """
+            Este método calcula y almacena los valores de Ri y Ni a partir de los centros, con operaciones vectoriales
+            por bloques de 'block_size'. En modo perezoso no almacena nada, porque los valores se derivan de los
+            centros al consultarlos. Si se recibe un StreamingStatistics, cada bloque de Ri se acumula en él al
+            calcularse, incluso en modo perezoso.
+        """
+        div_num = self.getDivNum(len_seed)
+        if self.lazy:
+            if statistics is not None:
+                for start in range(0, self.numAmount, block_size):
+                    statistics.update(self.centers[start:start + block_size].astype(np.float64) / div_num)
+            return
+
+        self.riValues = np.empty(self.numAmount, dtype=np.float64)
+        self.niValues = np.empty(self.numAmount, dtype=np.float64)
+        for start in range(0, self.numAmount, block_size):
+            ri_block = self.riValues[start:start + block_size]
+            np.divide(self.centers[start:start + block_size].astype(np.float64), div_num, out=ri_block)
+            self.niValues[start:start + block_size] = self.genNiNumber(ri_block)
+            if statistics is not None:
+                statistics.update(ri_block)
+
+    def computeRiBlock(self, centers):
+        """
+            Este método calcula los valores de Ri de un bloque de valores centrales.
+        """
+        return centers.astype(np.float64) / self.getDivNum(len(str(self.seed)))
+
+    def computeNiBlock(self, centers):
+        """
+            Este método calcula los valores de Ni de un bloque de valores centrales.
+        """
+        return self.genNiNumber(self.computeRiBlock(centers))
+
+    def iter_chunks(self, chunk_size=65536, statistics=None):
+        """
+            Este método recorre la secuencia en bloques de 'chunk_size' valores sin almacenarla, con memoria acotada.
+            Cada bloque es una tupla (xi, ri, ni) de arreglos NumPy; el último bloque puede ser más corto.
+            Igual que generateRandoms, al volver a una semilla ya vista registra la cola y el ciclo, y los bloques
+            siguientes se toman del ciclo en lugar de recalcular los cuadrados. Los valores son los mismos.
+            Si se recibe un StreamingStatistics, cada bloque de Ri se acumula en él antes de entregarse.
         """
         seed = self.seed
         len_seed = len(str(self.seed))
+        low_power, high_power = self.getCenterPowers(len_seed)
+        div_num = self.getDivNum(len_seed)
+        dtype = np.int64 if len_seed <= 9 else object
+        self.tail_length = None
+        self.cycle_length = None
+        seen = {}  # Posicion en la que aparecio cada semilla, hasta detectar el ciclo
+        cycle = None  # Semillas del ciclo, una vez detectado
+        for start in range(0, self.numAmount, chunk_size):
+            count = min(chunk_size, self.numAmount - start)
+            states = []
+            if cycle is None:
+                while len(states) < count and seed not in seen:
+                    seen[seed] = start + len(states)
+                    states.append(seed)
+                    seed = (seed * seed) // low_power % high_power
+                if len(states) < count:
+                    self.tail_length = seen[seed]
+                    self.cycle_length = len(seen) - seen[seed]
+                    cycle = np.array(list(seen)[self.tail_length:], dtype=dtype)
+                    seen = None
+
+            xi_block = np.array(states, dtype=dtype)
+            if len(states) < count:
+                positions = np.arange(start + len(states), start + count)
+                xi_block = np.concatenate([xi_block, cycle[(positions - self.tail_length) % self.cycle_length]])
+
+            # El valor central de cada semilla es la semilla siguiente
+            centers = xi_block * xi_block // low_power % high_power
+            ri_block = centers.astype(np.float64) / div_num
+            if statistics is not None:
+                statistics.update(ri_block)
+            yield xi_block, ri_block, self.genNiNumber(ri_block)
+
+    def tileCycle(self, position):
+        """
+            Este método completa las semillas restantes, desde 'position', repitiendo el ciclo detectado por
+            generateRandoms.
+        """
+        cycle = self.states[self.tail_length:position]
+        self.states[position:] = np.resize(cycle, len(self.states) - position)
+
+    def get_cycle_info(self):
+        """
+            Este método devuelve la longitud de la cola y la del ciclo detectados por generateRandoms.
+            Ambos valores son None si la secuencia no repitió ninguna semilla dentro de las iteraciones pedidas.
+        """
+        return self.tail_length, self.cycle_length
+
+    def generateRandomsFromTable(self, table, statistics=None):
+        """
+            Este método genera la secuencia consultando una tabla de sucesores precalculada (MiddleSquareTable),
+            sin calcular ningún cuadrado. La tabla debe corresponder a la longitud de dígitos de la semilla.
+            Al igual que generateRandoms, detecta el ciclo, completa el resto de los valores repitiéndolo y, si se
+            recibe un StreamingStatistics, acumula en él los Ri por bloques.
+        """
+        len_seed = len(str(self.seed))
+        if self.seed < 0 or len_seed != table.digits:
+            raise ValueError(f"The seed must be a non-negative number with {table.digits} digits.")
+
+        self.tail_length = None
+        self.cycle_length = None
+        successors = table.getSuccessors()
+        seen = {}  # Posicion en la que aparecio cada semilla
+        path = []
+        seed = self.seed
+        while len(path) < self.numAmount and seed not in seen:
+            seen[seed] = len(path)
+            path.append(seed)
+            seed = int(successors[seed])
+
+        if len(path) < self.numAmount:
+            self.tail_length = seen[seed]
+            self.cycle_length = len(path) - seen[seed]
+
+        states = self.allocateStates(len_seed)
+        states[:len(path)] = path
+        if self.tail_length is not None:
+            self.tileCycle(len(path))
+        else:
+            states[self.numAmount] = seed
+
+        self.fillRiAndNiValues(len_seed, statistics)
+
+    def generateRandomsBatch(self, seeds):
+        """
+            Este método aplica el método del cuadrado medio a varias semillas a la vez, avanzándolas al mismo paso con
+            operaciones vectoriales de NumPy. Cada semilla conserva su propia longitud de dígitos.
+            Devuelve tres arreglos de forma (semillas, numAmount) con los valores de Xi, Ri y Ni de cada semilla.
+        """
+        seeds = [int(seed) for seed in seeds]
+        lengths = [len(str(seed)) for seed in seeds]
+        dtype = np.int64 if max(lengths, default=0) <= 9 else object
+        powers = [self.getCenterPowers(length) for length in lengths]
+        low_powers = np.array([low for low, high in powers], dtype=dtype)
+        high_powers = np.array([high for low, high in powers], dtype=dtype)
+        div_nums = np.array([self.getDivNum(length) for length in lengths], dtype=np.float64)
+
+        xi_values = np.empty((self.numAmount, len(seeds)), dtype=dtype)
+        centers = np.empty((self.numAmount, len(seeds)), dtype=dtype)
+        state = np.array(seeds, dtype=dtype)
         for i in range(self.numAmount):
-            self.xiValues.append(seed)
-            xi2 = seed * seed
-            center = self.getCenter(str(xi2))
-            self.centers.append(center)
-            ri = center / self.getDivNum(len_seed)
-            self.riValues.append(ri)
-            ni = self.genNiNumber(ri)
-            self.niValues.append(ni)
-            seed = center
+            xi_values[i] = state
+            state = (state * state) // low_powers % high_powers
+            centers[i] = state
+
+        ri_values = centers.astype(np.float64) / div_nums
+        ni_values = self.min + (self.max - self.min) * ri_values
+        return xi_values.T, ri_values.T, ni_values.T
 
     def genNiNumber(self, ri):
         """
@@ -40,52 +229,48 @@ class MiddleSquareMethod:
         """
         return self.min + ((self.max - self.min) * ri)
 
+    def getCenterPowers(self, length):
+        """
+            Este método devuelve las potencias de diez que extraen los dígitos centrales de un cuadrado.
+            Con el cuadrado rellenado a 2 * length dígitos, el centro empieza en la posición length // 2, así que
+            centro = (cuadrado // 10^(length - length // 2)) % 10^length.
+        """
+        return 10 ** (length - length // 2), 10 ** length
+
     def getCenter(self, num):
         """
             Este método extrae los dígitos centrales de un número determinado.
         """
-        len_seed = len(str(self.seed))
-        len_num = len(str(num))
-        padded = ""
-
-        if len_num == (len_seed * 2):
-            padded = num
-        elif len(num) < len_seed * 2:
-            while len(padded) < len_seed * 2 - len_num:
-                padded = "0" + padded
-            padded += num
-
-        startIndex = int(len_seed / 2)
-        endIndex = startIndex + len_seed
-        center = padded[startIndex:endIndex]
-
-        return int(center)
+        low_power, high_power = self.getCenterPowers(len(str(self.seed)))
+        return int(num) // low_power % high_power
 
     def getDivNum(self, length):
         """
             Este método genera un número divisor basado en la longitud de la semilla.
             Se utiliza para calcular los valores de Ri.
         """
-        num = ""
-        for i in range(length):
-            num += "0"
-        num = "1" + num
-        return float(num)
+        return float(10 ** length)
 
     def get_xi_values_array(self):
         """
-            Este método devuelve el arreglo de valores Xi.
+            Este método devuelve el arreglo de valores Xi, sin copiarlo.
         """
         return self.xiValues
 
     def get_ri_values_array(self):
         """
-            Este método devuelve el arreglo de valores Ri.
+            Este método devuelve el arreglo de valores Ri, sin copiarlo.
+            En modo perezoso devuelve una vista que calcula los valores a partir de los centros al consultarlos.
         """
+        if self.lazy:
+            return LazyValuesView(self.centers, self.computeRiBlock)
         return self.riValues
 
     def get_ni_values_array(self):
         """
-            Este método devuelve el arreglo de valores Ni.
+            Este método devuelve el arreglo de valores Ni, sin copiarlo.
+            En modo perezoso devuelve una vista que calcula los valores a partir de los centros al consultarlos.
         """
+        if self.lazy:
+            return LazyValuesView(self.centers, self.computeNiBlock)
         return self.niValues
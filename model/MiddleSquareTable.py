@@ -0,0 +1,112 @@
+import os
+
+import numpy as np
+
+class MiddleSquareTable:
+    """
+        Esta clase precalcula la tabla de sucesores del método del cuadrado medio para todas las semillas de una
+        longitud de dígitos dada. Con la tabla, generar una secuencia se reduce a consultas y las estadísticas de cola y
+        ciclo de todas las semillas se obtienen recorriendo el grafo funcional completo.
+    """
+
+    MAX_DIGITS = 8  # Longitud maxima admitida: 10^8 estados de 4 bytes ocupan 400 MB
+
+    __slots__ = ('digits', 'path', 'successors')
+
+    def __init__(self, digits, path=None):
+        """
+            Este es el método constructor de la clase MiddleSquareTable.
+            Recibe la longitud de dígitos de las semillas y, opcionalmente, la ruta del archivo .npy donde persistir
+            la tabla. Si el archivo ya existe se reutiliza mediante un mapa de memoria.
+        """
+        if not 1 <= digits <= self.MAX_DIGITS:
+            raise ValueError(f"The number of digits must be between 1 and {self.MAX_DIGITS}.")
+
+        self.digits = digits  # Longitud de digitos de las semillas
+        self.path = path  # Ruta del archivo .npy, o None para mantener la tabla solo en memoria
+        self.successors = None  # Arreglo de sucesores, indexado por semilla
+
+    def getStateCount(self):
+        """
+            Este método devuelve el número de estados posibles, 10^digits.
+        """
+        return 10 ** self.digits
+
+    def build(self, chunk_size=1 << 22):
+        """
+            Este método calcula el sucesor de cada semilla con operaciones vectoriales, por bloques de 'chunk_size'.
+            Si se indicó una ruta, la tabla se escribe directamente en un archivo .npy mapeado en memoria.
+        """
+        state_count = self.getStateCount()
+        low_power = 10 ** (self.digits - self.digits // 2)
+        if self.path is None:
+            successors = np.empty(state_count, dtype=np.uint32)
+        else:
+            successors = np.lib.format.open_memmap(self.path, mode='w+', dtype=np.uint32, shape=(state_count,))
+
+        for start in range(0, state_count, chunk_size):
+            states = np.arange(start, min(start + chunk_size, state_count), dtype=np.int64)
+            successors[start:start + len(states)] = (states * states) // low_power % state_count
+
+        if self.path is not None:
+            successors.flush()
+            successors = np.load(self.path, mmap_mode='r')
+        self.successors = successors
+        return successors
+
+    def getSuccessors(self):
+        """
+            Este método devuelve la tabla de sucesores. La carga desde el archivo si ya existe o la construye si no.
+        """
+        if self.successors is None:
+            if self.path is not None and os.path.exists(self.path):
+                self.successors = np.load(self.path, mmap_mode='r')
+            else:
+                self.build()
+        return self.successors
+
+    def cycleStatistics(self):
+        """
+            Este método calcula, para todas las semillas a la vez, la longitud de la cola antes de entrar a un ciclo y
+            la longitud de ese ciclo. Devuelve dos arreglos (colas, ciclos) indexados por semilla.
+
+            Primero se eliminan por capas los nodos sin predecesores hasta que solo quedan los nodos de los ciclos;
+            luego se mide cada ciclo una sola vez, desde uno de sus nodos, y finalmente se recorren las capas en orden
+            inverso, de modo que el sucesor de cada nodo ya tiene su cola calculada. Cada nodo se visita una sola vez en
+            cada etapa.
+        """
+        successors = np.asarray(self.getSuccessors())
+        state_count = len(successors)
+
+        # Elimina por capas los nodos con grado de entrada cero; los que sobreviven forman los ciclos.
+        indegree = np.bincount(successors, minlength=state_count)
+        on_cycle = np.ones(state_count, dtype=bool)
+        frontier = np.flatnonzero(indegree == 0)
+        layers = []
+        while frontier.size:
+            layers.append(frontier)
+            on_cycle[frontier] = False
+            targets, counts = np.unique(successors[frontier], return_counts=True)
+            indegree[targets] -= counts
+            frontier = targets[indegree[targets] == 0]
+
+        # Mide cada ciclo una sola vez: lo recorre desde uno de sus nodos y asigna la longitud a todos sus miembros.
+        cycle_lengths = np.zeros(state_count, dtype=np.int64)
+        for start in np.flatnonzero(on_cycle):
+            if cycle_lengths[start]:
+                continue
+            members = [int(start)]
+            node = int(successors[start])
+            while node != start:
+                members.append(node)
+                node = int(successors[node])
+            cycle_lengths[members] = len(members)
+
+        # Propaga colas y ciclos desde los nodos del ciclo hacia sus predecesores, en orden inverso de eliminación.
+        tail_lengths = np.zeros(state_count, dtype=np.int64)
+        for layer in reversed(layers):
+            targets = successors[layer]
+            tail_lengths[layer] = tail_lengths[targets] + 1
+            cycle_lengths[layer] = cycle_lengths[targets]
+
+        return tail_lengths, cycle_lengths
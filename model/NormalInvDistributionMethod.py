@@ -1,79 +1,142 @@
 import numpy as np
-from scipy.stats import norm
+
+from model.InverseNormal import normalPpf
+from model.RandomSource import RandomSource
 
 class NormalInvDistributionMethod:
     """
         Esta clase implementa el método de distribución inversa normal para generar números pseudoaleatorios.
     """
 
-    def __init__(self, num_amount_xi, min, max, iterations):
+    __slots__ = ('num_amount_xi', 'min', 'max', 'iterations', 'random_source', 'ri_values', 'ni_values',
+                 'random_values_1', 'random_values_2', 'xi_values', 'xi_average', 'xi_deviation')
+
+    def __init__(self, num_amount_xi, min, max, iterations, seed=None, bit_generator='PCG64'):
         """
             Este es el método constructor de la clase NormalInvDistributionMethod.
             Inicializa la clase con los parámetros dados.
+            'seed' puede ser un entero, un numpy.random.SeedSequence o un numpy.random.Generator; con la misma semilla
+            se obtiene siempre la misma secuencia. 'bit_generator' puede ser 'PCG64', 'Philox' o 'SFC64'.
         """
         self.num_amount_xi = num_amount_xi  # Cantidad de numeros Xi a generar
         self.min = min  # Valor minimo para el rango de numeros aleatorios a crear
         self.max = max  # Valor maximo para el rango de numeros aleatorios a crear
         self.iterations = iterations  # Numero de iteraciones
-        self.ri_values = []  # Lista para almacenar los valores de Ri
-        self.ni_values = []  # Lista para almacenar los valores de Ni
-        self.random_values_1 = []  # Lista para almacenar el primer arreglo de numeros aleatorios
-        self.random_values_2 = []  # Lista para almacenar el segundo arreglo de numeros aleatorios
-        self.xi_values = []  # Lista para almacenar los valores de Xi
+        self.random_source = RandomSource(seed, bit_generator)  # Fuente de aleatoriedad
+        self.ri_values = np.empty(0, dtype=np.float64)  # Arreglo para almacenar los valores de Ri
+        self.ni_values = np.empty(0, dtype=np.float64)  # Arreglo para almacenar los valores de Ni
+        self.random_values_1 = np.empty(0, dtype=np.float64)  # Primer arreglo de numeros aleatorios
+        self.random_values_2 = np.empty(0, dtype=np.float64)  # Segundo arreglo de numeros aleatorios
+        self.xi_values = np.empty(0, dtype=np.float64)  # Arreglo de valores Xi, solo si se piden explicitamente
+        self.xi_average = None  # Promedio de los valores Xi
+        self.xi_deviation = None  # Desviacion estandar de los valores Xi
+
+    def spawn(self, n):
+        """
+            Este método crea n copias del método con fuentes de aleatoriedad independientes entre sí,
+            para que varios trabajadores puedan generar en paralelo sin compartir estado.
+        """
+        return [NormalInvDistributionMethod(self.num_amount_xi, self.min, self.max, self.iterations,
+                                            source.seed_sequence, source.bit_generator)
+                for source in self.random_source.spawn(n)]
 
     def fillRandomValues1(self):
         """
             Este método genera y almacena el primer conjunto de valores aleatorios utilizando una distribución uniforme.
         """
-        for i in range(self.num_amount_xi):
-            random_number = np.random.uniform(self.min, self.max)
-            self.random_values_1.append(round(random_number, 5))
+        self.random_values_1 = self.random_source.fillUniform(np.empty(self.num_amount_xi), self.min, self.max)
 
     def fillRandomValues2(self):
         """
             Este método genera y almacena el segundo conjunto de valores aleatorios utilizando una distribución uniforme.
         """
-        for i in range(self.num_amount_xi):
-            random_value = np.random.uniform()
-            self.random_values_2.append(round(random_value, 5))
+        self.random_values_2 = self.random_source.fillUniform(np.empty(self.num_amount_xi))
+
+    def fillXiValues(self, materialize=False, block_size=1 << 20):
+        """
+            Este método calcula el promedio y la desviación estándar de los valores Xi, que son todas las sumas
+            random_values_1[i] + random_values_2[j]. Como cada par aparece una vez, la media de las sumas es la suma de
+            las medias y su varianza es la suma de las varianzas, así que no hace falta construir las n² sumas.
+            Solo si 'materialize' es True se almacenan además los valores Xi, construidos por bloques de filas de como
+            máximo 'block_size' valores.
+        """
+        values_1 = np.asarray(self.random_values_1, dtype=np.float64)
+        values_2 = np.asarray(self.random_values_2, dtype=np.float64)
+        self.xi_average = np.mean(values_1) + np.mean(values_2)
+        self.xi_deviation = np.sqrt(np.var(values_1) + np.var(values_2))
+
+        if materialize:
+            self.xi_values = np.empty(len(values_1) * len(values_2), dtype=np.float64)
+            position = 0
+            for block in self.generateXiBlocks(block_size):
+                self.xi_values[position:position + len(block)] = block
+                position += len(block)
 
-    def fillXiValues(self):
+    def generateXiBlocks(self, block_size=1 << 20):
         """
-            Este método calcula y almacena valores Xi en función de los dos conjuntos de valores aleatorios.
+            Este método genera los valores Xi en el mismo orden que la cuadrícula completa, por bloques de filas
+            enteras de como máximo 'block_size' valores (al menos una fila), sin almacenar nunca la cuadrícula entera.
         """
-        for i in range(len(self.random_values_1)):
-            for j in range(len(self.random_values_2)):
-                self.xi_values.append(self.random_values_1[i] + self.random_values_2[j])
+        values_1 = np.asarray(self.random_values_1, dtype=np.float64)
+        values_2 = np.asarray(self.random_values_2, dtype=np.float64)
+        rows = max(1, block_size // max(1, len(values_2)))
+        for start in range(0, len(values_1), rows):
+            yield np.add.outer(values_1[start:start + rows], values_2).ravel()
 
     def findXiValuesAverage(self):
         """
             Este método calcula y devuelve el promedio de los valores Xi.
         """
-        return np.mean(self.xi_values)
+        return self.xi_average
 
     def findXiValuesSDeviation(self):
         """
             Este método calcula y devuelve la desviación estándar de los valores Xi.
         """
-        return np.std(self.xi_values)
+        return self.xi_deviation
 
-    def fillRiValues(self):
+    def fillRiValues(self, block_size=1 << 20, statistics=None):
         """
             Este método genera y almacena valores de Ri utilizando una distribución uniforme.
-        """
-        for i in range(self.iterations):
-            random_number = np.random.uniform()
-            self.ri_values.append(round(random_number, 5))
+            Los valores se extraen del generador en bloques de 'block_size' y se conservan con precisión completa.
+            Si se recibe un StreamingStatistics, cada bloque se acumula en él apenas se extrae.
+        """
+        self.ri_values = np.empty(self.iterations)
+        for start in range(0, len(self.ri_values), block_size):
+            block = self.random_source.fillUniform(self.ri_values[start:start + block_size], block_size=block_size)
+            if statistics is not None:
+                statistics.update(block)
 
-    def fillNiValues(self):
+    def fillNiValues(self, chunk_size=1 << 20, workers=None, backend=None):
         """
             Este método calcula y almacena los valores de Ni basándose en los valores de Ri utilizando la distribución inversa de la normal.
+            La transformación se aplica a todo el arreglo de Ri a la vez, por bloques repartidos en un grupo de hilos.
+            'backend' elige entre scipy y la aproximación AS241 incluida; por defecto se usa scipy si está instalado.
         """
         average = self.findXiValuesAverage()
         standard_deviation = self.findXiValuesSDeviation()
 
-        for i in range(len(self.ri_values)):
-            self.ni_values.append(round(norm.ppf(self.ri_values[i], loc=average, scale=standard_deviation), 5))
+        self.ni_values = normalPpf(self.ri_values, average, standard_deviation, chunk_size, workers, backend)
+
+    def iter_chunks(self, chunk_size=65536, statistics=None):
+        """
+            Este método genera los valores en bloques de 'chunk_size' sin almacenarlos, con memoria acotada.
+            Cada bloque es una tupla (ri, ni) de arreglos NumPy; el último bloque puede ser más corto.
+            Si se recibe un StreamingStatistics, cada bloque de Ri se acumula en él antes de entregarse.
+            Si aún no se calcularon el promedio y la desviación de los Xi, se calculan primero.
+        """
+        if self.xi_average is None:
+            self.fillRandomValues1()
+            self.fillRandomValues2()
+            self.fillXiValues()
+
+        average = self.findXiValuesAverage()
+        standard_deviation = self.findXiValuesSDeviation()
+        for start in range(0, self.iterations, chunk_size):
+            ri_block = self.random_source.fillUniform(np.empty(min(chunk_size, self.iterations - start)))
+            if statistics is not None:
+                statistics.update(ri_block)
+            yield ri_block, normalPpf(ri_block, average, standard_deviation, chunk_size)
 
     def get_ri_values_array(self):
         """
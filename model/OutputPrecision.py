@@ -0,0 +1,43 @@
+import numpy as np
+
+from model.RoundingUtils import roundArray
+
+class OutputPrecision:
+    """
+        Esta clase define la precisión con la que se muestran y exportan los valores generados.
+        Los métodos generan siempre con precisión completa; el redondeo a 'decimals' cifras se aplica una sola vez,
+        de forma vectorial, al momento de mostrar o exportar los valores.
+    """
+
+    __slots__ = ('decimals',)
+
+    def __init__(self, decimals=5):
+        """
+            Este es el método constructor de la clase OutputPrecision.
+            'decimals' es el número de cifras decimales de salida, o None para conservar la precisión completa.
+        """
+        if decimals is not None and decimals < 0:
+            raise ValueError("The number of decimals cannot be negative.")
+        self.decimals = decimals  # Numero de cifras decimales, o None para precision completa
+
+    def isFull(self):
+        """
+            Este método indica si la salida conserva la precisión completa.
+        """
+        return self.decimals is None
+
+    def apply(self, values):
+        """
+            Este método redondea un arreglo completo de valores a la precisión de salida.
+            Con precisión completa devuelve los mismos valores, sin copiarlos.
+        """
+        if self.isFull():
+            return values
+        return roundArray(np.asarray(values, dtype=np.float64), self.decimals)
+
+    def applyChunks(self, chunks):
+        """
+            Este método redondea, bloque por bloque, una secuencia de bloques de valores.
+        """
+        for chunk in chunks:
+            yield self.apply(chunk)
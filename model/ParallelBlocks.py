@@ -0,0 +1,89 @@
+import os
+
+import numpy as np
+
+
+def splitRange(count, parts):
+    """
+        Esta función divide el rango de índices [0, count) en como máximo 'parts' bloques contiguos de tamaño similar.
+        Devuelve una lista de pares (inicio, cantidad) en orden.
+    """
+    parts = max(1, min(parts, count))
+    base, extra = divmod(count, parts)
+    ranges = []
+    start = 0
+    for i in range(parts):
+        size = base + (1 if i < extra else 0)
+        if size > 0:
+            ranges.append((start, size))
+        start += size
+    return ranges
+
+
+def resolveWorkers(workers):
+    """
+        Esta función devuelve el número de procesos a utilizar; por defecto, uno por núcleo disponible.
+    """
+    return workers if workers else (os.cpu_count() or 1)
+
+
+def runBlocks(function, arguments, workers=None):
+    """
+        Esta función ejecuta 'function' sobre cada tupla de 'arguments' en un ProcessPoolExecutor.
+        Los resultados se devuelven en el mismo orden de los argumentos, a medida que están disponibles.
+    """
+    # Se importa aquí porque cargar multiprocessing es costoso y solo hace falta al generar en paralelo
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=resolveWorkers(workers)) as executor:
+        yield from executor.map(function, *zip(*arguments))
+
+
+def runSharedBlocks(function, arguments, outputs, workers=None):
+    """
+        Esta función ejecuta 'function' sobre cada tupla de 'arguments' en un ProcessPoolExecutor, agregando al final
+        de cada tupla la ruta y la disposición de un archivo compartido con un arreglo por cada par (dtype, cantidad)
+        de 'outputs'. Los procesos escriben sus resultados directamente en ese archivo (ver writeShared), mapeado en
+        memoria, y solo devuelven un estado, así que no se serializa ni se copia ningún arreglo.
+        Devuelve la lista de estados, en el orden de los argumentos, y la lista de arreglos resultantes, que siguen
+        respaldados por el mapa de memoria.
+    """
+    # Se importa aquí porque solo hace falta al generar en paralelo
+    import tempfile
+
+    # Usa un sistema de archivos en memoria si existe, para que los valores nunca se escriban en disco
+    directory = '/dev/shm' if os.path.isdir('/dev/shm') else None
+    descriptor, path = tempfile.mkstemp(suffix='.bin', dir=directory)
+    os.close(descriptor)
+    try:
+        layout = []
+        size = 0
+        for dtype, count in outputs:
+            layout.append((np.dtype(dtype).str, count, size))
+            size += np.dtype(dtype).itemsize * count
+        os.truncate(path, max(1, size))
+
+        arrays = [np.memmap(path, dtype, 'r+', offset, (count,)).view(np.ndarray) for dtype, count, offset in layout]
+        results = list(runBlocks(function, [argument + (path, tuple(layout)) for argument in arguments], workers))
+    except BaseException:
+        os.unlink(path)
+        raise
+
+    # Los mapas de memoria siguen siendo válidos tras borrar el archivo. Si el sistema no permite borrar un archivo
+    # mapeado (Windows), los arreglos se copian a memoria propia antes de borrarlo.
+    try:
+        os.unlink(path)
+    except OSError:
+        arrays = [np.array(array) for array in arrays]
+        os.unlink(path)
+    return results, arrays
+
+
+def writeShared(path, layout, start, count, write):
+    """
+        Esta función se ejecuta en los procesos de runSharedBlocks: mapea las posiciones [start, start + count) de
+        cada arreglo del archivo compartido y llama a 'write' con ellas.
+    """
+    write(*[np.memmap(path, dtype, 'r+', offset + start * np.dtype(dtype).itemsize, (count,))
+            for dtype, total, offset in layout])
+    return count
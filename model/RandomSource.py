@@ -0,0 +1,66 @@
+import numpy as np
+
+class RandomSource:
+    """
+        Esta clase administra la fuente de aleatoriedad de los métodos basados en distribuciones.
+        Envuelve un numpy.random.Generator explícito, reproducible a partir de una semilla y con un generador de bits
+        seleccionable, en lugar del estado global de np.random.
+    """
+
+    BIT_GENERATORS = {
+        'PCG64': np.random.PCG64,
+        'Philox': np.random.Philox,
+        'SFC64': np.random.SFC64,
+    }
+
+    __slots__ = ('bit_generator', 'generator', 'seed_sequence')
+
+    def __init__(self, seed=None, bit_generator='PCG64'):
+        """
+            Este es el método constructor de la clase RandomSource.
+            'seed' puede ser None (entropía del sistema), un entero, un numpy.random.SeedSequence o un
+            numpy.random.Generator ya construido, que se usa tal cual con cualquier generador de bits; el nombre del
+            generador de bits se toma de él. Solo al construir un generador nuevo a partir de una semilla, incluidas
+            las fuentes hijas de spawn, el generador de bits debe ser uno de BIT_GENERATORS.
+        """
+        if isinstance(seed, np.random.Generator):
+            bit_generator = type(seed.bit_generator).__name__
+        elif bit_generator not in self.BIT_GENERATORS:
+            raise ValueError(f"Unknown bit generator: {bit_generator}. "
+                             f"Available: {', '.join(self.BIT_GENERATORS)}.")
+
+        self.bit_generator = bit_generator  # Nombre del generador de bits
+        if isinstance(seed, np.random.Generator):
+            self.generator = seed
+            self.seed_sequence = seed.bit_generator.seed_seq
+        else:
+            self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+            self.generator = np.random.Generator(self.BIT_GENERATORS[bit_generator](self.seed_sequence))
+
+    def getSeed(self):
+        """
+            Este método devuelve la entropía de la semilla, con la que se puede reproducir la misma secuencia.
+        """
+        return self.seed_sequence.entropy
+
+    def spawn(self, n):
+        """
+            Este método crea n fuentes hijas con secuencias estadísticamente independientes, para trabajadores paralelos.
+            Las hijas se construyen con el mismo generador de bits, que debe ser uno de BIT_GENERATORS.
+        """
+        if self.bit_generator not in self.BIT_GENERATORS:
+            raise ValueError(f"Cannot spawn sources with the {self.bit_generator} bit generator. "
+                             f"Available: {', '.join(self.BIT_GENERATORS)}.")
+        return [RandomSource(child, self.bit_generator) for child in self.seed_sequence.spawn(n)]
+
+    def fillUniform(self, out, low=0.0, high=1.0, block_size=1 << 20):
+        """
+            Este método llena el arreglo 'out' con valores uniformes en [low, high), extraídos por bloques.
+        """
+        for start in range(0, len(out), block_size):
+            block = out[start:start + block_size]
+            self.generator.random(out=block)
+            if low != 0.0 or high != 1.0:
+                block *= (high - low)
+                block += low
+        return out
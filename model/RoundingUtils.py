@@ -0,0 +1,20 @@
+import numpy as np
+
+
+def roundArray(values, decimals):
+    """
+        Esta función redondea un arreglo de flotantes a 'decimals' cifras, con el mismo resultado que round() de Python.
+        np.round solo difiere de round() cuando el valor escalado queda prácticamente en la mitad entre dos enteros o es
+        demasiado grande para representarse exactamente; esos casos se resuelven de nuevo con round().
+    """
+    values = np.asarray(values, dtype=np.float64)
+    factor = 10.0 ** decimals
+    scaled = values * factor
+    rounded = np.rint(scaled) / factor
+
+    with np.errstate(invalid='ignore'):
+        tolerance = np.abs(scaled) * 2.0 ** -50 + 1e-12
+        doubtful = (np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) <= tolerance) | ~(np.abs(scaled) < 2.0 ** 52)
+    for index in np.flatnonzero(doubtful):
+        rounded.flat[index] = round(float(values.flat[index]), decimals)
+    return rounded
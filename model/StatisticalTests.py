@@ -0,0 +1,226 @@
+import math
+
+import numpy as np
+
+from model.Histogram import Histogram
+from model.InverseNormal import ppnd16
+
+# scipy es opcional y costoso de importar, así que se carga solo la primera vez que se necesita
+_chi2_ppf = None
+_chi2_ppf_loaded = False
+
+# Probabilidades de cada mano de la prueba de póker con 5 cifras decimales, en el orden de POKER_HANDS
+POKER_HANDS = ('All different', 'One pair', 'Two pairs', 'Three of a kind', 'Full house', 'Four of a kind',
+               'Five of a kind')
+POKER_PROBABILITIES = np.array([0.3024, 0.504, 0.108, 0.072, 0.009, 0.0045, 0.0001])
+
+# Mano de póker de cada número de 5 cifras (00000 a 99999), calculada la primera vez que se necesita
+_poker_table = None
+
+
+def pokerTable():
+    """
+        Esta función devuelve la mano de póker de cada número de 5 cifras, como índice de POKER_HANDS.
+        La mano se identifica por la cantidad de pares de cifras iguales, que es distinta para cada una:
+        0, 1, 2, 3, 4, 6 o 10 pares.
+    """
+    global _poker_table
+    if _poker_table is None:
+        digits = np.arange(100000)[:, np.newaxis] // 10 ** np.arange(5) % 10
+        pairs = sum(digits[:, first] == digits[:, second] for first in range(4) for second in range(first + 1, 5))
+        lookup = np.zeros(11, dtype=np.int8)
+        lookup[[0, 1, 2, 3, 4, 6, 10]] = np.arange(len(POKER_HANDS))
+        _poker_table = lookup[pairs]
+    return _poker_table
+
+
+def loadChi2Ppf():
+    """
+        Esta función importa scipy.stats.chi2.ppf la primera vez que se llama y la guarda para los siguientes usos.
+        Devuelve None si scipy no está instalado.
+    """
+    global _chi2_ppf, _chi2_ppf_loaded
+    if not _chi2_ppf_loaded:
+        try:
+            from scipy.stats import chi2
+            ppf = chi2.ppf
+        except ImportError:
+            ppf = None
+        _chi2_ppf = ppf
+        _chi2_ppf_loaded = True
+    return _chi2_ppf
+
+
+def normalQuantile(p):
+    """
+        Esta función devuelve el cuantil 'p' de la distribución normal estándar.
+    """
+    return float(ppnd16(p))
+
+
+def chiSquareQuantile(p, degrees):
+    """
+        Esta función devuelve el cuantil 'p' de la distribución chi-cuadrado con 'degrees' grados de libertad.
+        Usa scipy si está instalado y, si no, la aproximación de Wilson-Hilferty.
+    """
+    ppf = loadChi2Ppf()
+    if ppf is not None:
+        return float(ppf(p, degrees))
+    z = normalQuantile(p)
+    factor = 2.0 / (9.0 * degrees)
+    return degrees * max(0.0, 1.0 - factor + z * math.sqrt(factor)) ** 3
+
+
+class StatisticalTests:
+    """
+        Esta clase aplica la batería de pruebas de aleatoriedad a una secuencia de valores Ri en [0, 1): medias,
+        varianza, chi-cuadrado, Kolmogorov-Smirnov, corridas arriba y abajo, y póker.
+        Cada prueba es vectorial (np.sort, np.bincount, np.diff) y recorre los valores por bloques, así que los
+        arreglos temporales no crecen con la cantidad de valores. Cada prueba devuelve un diccionario con el nombre,
+        el estadístico, los límites de aceptación y si la secuencia pasó la prueba.
+    """
+
+    # Cantidad de valores procesados por bloque, para que los arreglos temporales quepan en la caché
+    BLOCK_SIZE = 1 << 18
+
+    __slots__ = ('alpha', 'bins')
+
+    def __init__(self, alpha=0.05, bins=None):
+        """
+            Este es el método constructor de la clase StatisticalTests.
+            Recibe el nivel de significancia y la cantidad de intervalos de la prueba chi-cuadrado; por defecto se
+            usa la raíz cuadrada de la cantidad de valores.
+        """
+        if not 0 < alpha < 1:
+            raise ValueError("The significance level must be between 0 and 1.")
+        if bins is not None and bins < 2:
+            raise ValueError("The chi-square test needs at least 2 intervals.")
+        self.alpha = alpha  # Nivel de significancia
+        self.bins = bins  # Intervalos de la prueba chi-cuadrado, o None para usar la raíz de n
+
+    def blocks(self, values):
+        """
+            Este método recorre los valores en bloques de BLOCK_SIZE, sin copiarlos.
+        """
+        for start in range(0, len(values), self.BLOCK_SIZE):
+            yield start, values[start:start + self.BLOCK_SIZE]
+
+    def result(self, name, statistic, lower, upper):
+        """
+            Este método construye el resultado de una prueba. 'lower' es None en las pruebas de una sola cola.
+        """
+        passed = statistic <= upper and (lower is None or statistic >= lower)
+        return {'name': name, 'statistic': float(statistic), 'lower': None if lower is None else float(lower),
+                'upper': float(upper), 'passed': bool(passed)}
+
+    def meansTest(self, values):
+        """
+            Este método aplica la prueba de medias: el promedio de los valores debe estar en
+            1/2 ± z(1 - alpha/2) / sqrt(12n).
+        """
+        n = len(values)
+        mean = np.mean(values)
+        margin = normalQuantile(1 - self.alpha / 2) / math.sqrt(12 * n)
+        return self.result('Means', mean, 0.5 - margin, 0.5 + margin)
+
+    def varianceTest(self, values):
+        """
+            Este método aplica la prueba de varianza: la varianza muestral debe estar entre
+            chi2(alpha/2, n-1) / (12(n-1)) y chi2(1 - alpha/2, n-1) / (12(n-1)).
+        """
+        n = len(values)
+        mean = np.mean(values)
+        squares = sum(float(np.dot(block - mean, block - mean)) for start, block in self.blocks(values))
+        variance = squares / (n - 1)
+        scale = 12 * (n - 1)
+        return self.result('Variance', variance, chiSquareQuantile(self.alpha / 2, n - 1) / scale,
+                           chiSquareQuantile(1 - self.alpha / 2, n - 1) / scale)
+
+    def chiSquareTest(self, values):
+        """
+            Este método aplica la prueba chi-cuadrado de uniformidad con intervalos de igual ancho en [0, 1].
+            Las frecuencias se cuentan con Histogram, que usa np.bincount.
+        """
+        n = len(values)
+        bins = self.bins if self.bins is not None else max(2, math.isqrt(n))
+        observed = Histogram(bins, 0.0, 1.0).add(values).getCounts()
+        expected = n / bins
+        statistic = float(np.sum((observed - expected) ** 2)) / expected
+        return self.result('Chi-square', statistic, None, chiSquareQuantile(1 - self.alpha, bins - 1))
+
+    def kolmogorovSmirnovTest(self, values):
+        """
+            Este método aplica la prueba de Kolmogorov-Smirnov contra la distribución uniforme en [0, 1].
+            La distancia máxima se calcula sobre los valores ordenados; el valor crítico es la aproximación asintótica
+            sqrt(-ln(alpha/2) / 2) / sqrt(n).
+        """
+        n = len(values)
+        ordered = np.sort(values)
+        distance = 0.0
+        for start, block in self.blocks(ordered):
+            position = np.arange(start, start + len(block), dtype=np.float64)
+            distance = max(distance, float(np.max((position + 1) / n - block)), float(np.max(block - position / n)))
+        critical = math.sqrt(-math.log(self.alpha / 2) / 2) / math.sqrt(n)
+        return self.result('Kolmogorov-Smirnov', distance, None, critical)
+
+    def runsUpDownTest(self, values):
+        """
+            Este método aplica la prueba de corridas arriba y abajo: cuenta los cambios de dirección entre valores
+            consecutivos (np.diff) y compara el estadístico Z con ± z(1 - alpha/2). Un valor igual al anterior se
+            cuenta como descenso.
+        """
+        n = len(values)
+        runs = 1
+        previous = None
+        for start in range(0, n - 1, self.BLOCK_SIZE):
+            ascending = np.diff(values[start:start + self.BLOCK_SIZE + 1]) > 0
+            runs += int(np.count_nonzero(ascending[1:] != ascending[:-1]))
+            if previous is not None and ascending[0] != previous:
+                runs += 1
+            previous = ascending[-1]
+
+        expected = (2 * n - 1) / 3
+        deviation = math.sqrt((16 * n - 29) / 90)
+        z = normalQuantile(1 - self.alpha / 2)
+        return self.result('Runs up and down', (runs - expected) / deviation, -z, z)
+
+    def pokerTest(self, values):
+        """
+            Este método aplica la prueba de póker con las 5 primeras cifras decimales de cada valor.
+            La mano de cada valor se obtiene de una tabla con las 100000 combinaciones posibles, las frecuencias de
+            las manos se cuentan con np.bincount y se comparan con las esperadas mediante chi-cuadrado.
+        """
+        n = len(values)
+        table = pokerTable()
+        hands = np.zeros(len(POKER_HANDS), dtype=np.int64)
+        for start, block in self.blocks(values):
+            # El pequeño margen evita que 0.29 quede como 0.28999 por la representación binaria
+            numbers = np.clip(np.floor(block * 1e5 + 1e-7), 0, 99999).astype(np.intp)
+            hands += np.bincount(table[numbers], minlength=len(POKER_HANDS))
+
+        expected = POKER_PROBABILITIES * n
+        statistic = float(np.sum((hands - expected) ** 2 / expected))
+        return self.result('Poker', statistic, None, chiSquareQuantile(1 - self.alpha, len(POKER_HANDS) - 1))
+
+    def runAll(self, values):
+        """
+            Este método aplica todas las pruebas a los valores y devuelve la lista de resultados.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if len(values) < 2:
+            raise ValueError("The tests need at least 2 values.")
+        return [self.meansTest(values), self.varianceTest(values), self.chiSquareTest(values),
+                self.kolmogorovSmirnovTest(values), self.runsUpDownTest(values), self.pokerTest(values)]
+
+    @staticmethod
+    def formatReport(results):
+        """
+            Este método da formato de texto a los resultados, con una línea por prueba.
+        """
+        lines = []
+        for result in results:
+            lower = '-inf' if result['lower'] is None else f"{result['lower']:.6f}"
+            verdict = 'PASS' if result['passed'] else 'FAIL'
+            lines.append(f"{result['name']:<20} {result['statistic']:>14.6f}   "
+                         f"[{lower}, {result['upper']:.6f}]   {verdict}")
+        return '\n'.join(lines)
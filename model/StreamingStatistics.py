@@ -0,0 +1,184 @@
+import math
+
+import numpy as np
+
+from model.Histogram import Histogram
+from model.StatisticalTests import StatisticalTests, chiSquareQuantile, normalQuantile
+
+class StreamingStatistics:
+    """
+        Esta clase acumula, bloque por bloque y mientras se generan, las estadísticas de una secuencia de valores Ri:
+        cantidad, media y varianza (Welford, combinando cada bloque con la fórmula de Chan), frecuencias de intervalos
+        fijos para chi-cuadrado, mínimo y máximo, y cantidad de corridas arriba y abajo.
+        La memoria usada es constante, sin importar la cantidad de valores, y el informe está disponible apenas termina
+        la generación, sin volver a recorrer los valores. Las estadísticas de tramos consecutivos acumuladas por
+        separado, por ejemplo en varios procesos, se combinan con merge.
+    """
+
+    # Cantidad de valores procesados por bloque, para que los arreglos temporales quepan en la caché
+    BLOCK_SIZE = 1 << 18
+
+    __slots__ = ('alpha', 'count', 'mean', 'squares', 'minimum', 'maximum', 'histogram', 'changes', 'first_value',
+                 'first_ascending', 'last_value', 'last_ascending')
+
+    def __init__(self, bins=100, alpha=0.05):
+        """
+            Este es el método constructor de la clase StreamingStatistics.
+            Recibe la cantidad de intervalos de igual ancho en [0, 1] para la prueba chi-cuadrado y el nivel de
+            significancia del informe.
+        """
+        if not 0 < alpha < 1:
+            raise ValueError("The significance level must be between 0 and 1.")
+        if bins < 2:
+            raise ValueError("The chi-square test needs at least 2 intervals.")
+        self.alpha = alpha  # Nivel de significancia
+        self.count = 0  # Cantidad de valores acumulados
+        self.mean = 0.0  # Media de los valores acumulados
+        self.squares = 0.0  # Suma de los cuadrados de las desviaciones respecto de la media
+        self.minimum = math.inf  # Valor minimo
+        self.maximum = -math.inf  # Valor maximo
+        self.histogram = Histogram(bins, 0.0, 1.0)  # Frecuencias de los intervalos para chi-cuadrado
+        self.changes = 0  # Cambios de direccion entre valores consecutivos
+        self.first_value = None  # Primer valor acumulado, para continuar las corridas al combinar con merge
+        self.first_ascending = None  # Direccion entre los dos primeros valores acumulados
+        self.last_value = None  # Ultimo valor acumulado, para continuar las corridas en el bloque siguiente
+        self.last_ascending = None  # Direccion entre los dos ultimos valores acumulados
+
+    def update(self, values):
+        """
+            Este método agrega un bloque de valores a las estadísticas. Los bloques grandes se procesan por partes.
+            Devuelve el propio objeto.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        for start in range(0, len(values), self.BLOCK_SIZE):
+            self.updateBlock(values[start:start + self.BLOCK_SIZE])
+        return self
+
+    def updateBlock(self, block):
+        """
+            Este método agrega un bloque de valores, combinando su media y su suma de cuadrados con las acumuladas.
+        """
+        if not len(block):
+            return
+
+        if self.first_value is None:
+            self.first_value = float(block[0])
+
+        count = len(block)
+        mean = float(np.mean(block))
+        deviations = block - mean
+        squares = float(np.dot(deviations, deviations))
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.squares += squares + delta * delta * self.count * count / total
+        self.count = total
+
+        self.minimum = min(self.minimum, float(block.min()))
+        self.maximum = max(self.maximum, float(block.max()))
+        self.histogram.add(block)
+
+        # La dirección entre el último valor del bloque anterior y el primero de este continúa las corridas
+        if self.last_value is not None:
+            ascending = np.diff(block, prepend=self.last_value) > 0
+        else:
+            ascending = np.diff(block) > 0
+        if len(ascending):
+            self.changes += int(np.count_nonzero(ascending[1:] != ascending[:-1]))
+            if self.last_ascending is not None and ascending[0] != self.last_ascending:
+                self.changes += 1
+            if self.first_ascending is None:
+                self.first_ascending = bool(ascending[0])
+            self.last_ascending = bool(ascending[-1])
+        self.last_value = float(block[-1])
+
+    def empty(self):
+        """
+            Este método devuelve un acumulador vacío con los mismos intervalos y nivel de significancia, para acumular
+            por separado un tramo que luego se combina con merge.
+        """
+        return StreamingStatistics(self.histogram.bins, self.alpha)
+
+    def merge(self, other):
+        """
+            Este método agrega las estadísticas de 'other', acumuladas sobre los valores que siguen inmediatamente a
+            los de este objeto. El resultado es el mismo que si todos los valores se hubieran agregado con update.
+            Devuelve el propio objeto.
+        """
+        if other.histogram.bins != self.histogram.bins:
+            raise ValueError("The statistics to merge must use the same number of intervals.")
+        if not other.count:
+            return self
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.squares += other.squares + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.histogram.counts += other.histogram.counts
+
+        # La dirección entre el último valor de este tramo y el primero del otro une las corridas de ambos
+        self.changes += other.changes
+        if self.count:
+            ascending = other.first_value > self.last_value
+            if self.last_ascending is not None and ascending != self.last_ascending:
+                self.changes += 1
+            if other.first_ascending is not None and ascending != other.first_ascending:
+                self.changes += 1
+            if self.first_ascending is None:
+                self.first_ascending = ascending
+            self.last_ascending = other.last_ascending if other.last_ascending is not None else ascending
+        else:
+            self.first_value = other.first_value
+            self.first_ascending = other.first_ascending
+            self.last_ascending = other.last_ascending
+        self.last_value = other.last_value
+        self.count = total
+        return self
+
+    def getVariance(self):
+        """
+            Este método devuelve la varianza muestral de los valores acumulados.
+        """
+        return self.squares / (self.count - 1) if self.count > 1 else math.nan
+
+    def getRuns(self):
+        """
+            Este método devuelve la cantidad de corridas arriba y abajo de los valores acumulados.
+        """
+        return self.changes + 1 if self.count > 1 else 0
+
+    def report(self):
+        """
+            Este método devuelve los resultados de las pruebas de medias, varianza, chi-cuadrado y corridas arriba y
+            abajo sobre los valores acumulados, con el mismo formato que StatisticalTests.
+        """
+        n = self.count
+        if n < 2:
+            raise ValueError("The tests need at least 2 values.")
+        tests = StatisticalTests(self.alpha)
+        z = normalQuantile(1 - self.alpha / 2)
+
+        margin = z / math.sqrt(12 * n)
+        scale = 12 * (n - 1)
+        bins = self.histogram.bins
+        expected = n / bins
+        chi_square = float(np.sum((self.histogram.getCounts() - expected) ** 2)) / expected
+        runs = (self.getRuns() - (2 * n - 1) / 3) / math.sqrt((16 * n - 29) / 90)
+
+        return [tests.result('Means', self.mean, 0.5 - margin, 0.5 + margin),
+                tests.result('Variance', self.getVariance(), chiSquareQuantile(self.alpha / 2, n - 1) / scale,
+                             chiSquareQuantile(1 - self.alpha / 2, n - 1) / scale),
+                tests.result('Chi-square', chi_square, None, chiSquareQuantile(1 - self.alpha, bins - 1)),
+                tests.result('Runs up and down', runs, -z, z)]
+
+    def formatSummary(self):
+        """
+            Este método resume en una línea las estadísticas acumuladas y el resultado de cada prueba.
+        """
+        if self.count < 2:
+            return f"{self.count} values"
+        verdicts = ', '.join(f"{result['name']}: {'PASS' if result['passed'] else 'FAIL'}" for result in self.report())
+        return (f"{self.count} values, mean {self.mean:.6f}, variance {self.getVariance():.6f}, "
+                f"min {self.minimum:.6f}, max {self.maximum:.6f} | {verdicts}")
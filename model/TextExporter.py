@@ -0,0 +1,77 @@
+import numpy as np
+
+class TextExporter:
+    """
+        Esta clase escribe los valores generados en archivos de texto plano, un valor por línea.
+        Los valores se formatean por bloques (una sola operación de formato por bloque) y se escriben a través de un
+        búfer grande, consumiendo los bloques a medida que se generan, de modo que la memoria usada no depende de la
+        cantidad total de valores.
+    """
+
+    __slots__ = ('decimals', 'chunk_size', 'buffer_size')
+
+    def __init__(self, decimals=None, chunk_size=1 << 18, buffer_size=1 << 24):
+        """
+            Este es el método constructor de la clase TextExporter.
+            'decimals' fija el número de cifras decimales de cada línea; con None cada valor se escribe con su
+            representación más corta (igual que str()), tal como lo hacía la aplicación originalmente.
+        """
+        if decimals is not None and decimals < 0:
+            raise ValueError("The number of decimals cannot be negative.")
+
+        self.decimals = decimals  # Numero de cifras decimales, o None para la representacion mas corta
+        self.chunk_size = chunk_size  # Cantidad de valores formateados por bloque
+        self.buffer_size = buffer_size  # Tamaño en bytes del búfer de escritura
+
+    def getExtension(self):
+        """
+            Este método devuelve la extensión de archivo de los archivos de texto.
+        """
+        return '.txt'
+
+    def formatChunk(self, chunk):
+        """
+            Este método convierte un bloque de valores en el texto correspondiente, con un valor por línea.
+        """
+        values = np.asarray(chunk).tolist()
+        if not values:
+            return ''
+        if self.decimals is None:
+            return '\n'.join(map(repr, values)) + '\n'
+        return (f'%.{self.decimals}f\n' * len(values)) % tuple(values)
+
+    def write(self, path, values):
+        """
+            Este método escribe un arreglo completo de valores, o una vista con iter_chunks, en el archivo 'path'.
+        """
+        if hasattr(values, 'iter_chunks'):
+            chunks = values.iter_chunks(self.chunk_size)
+        else:
+            values = np.asarray(values)
+            chunks = (values[start:start + self.chunk_size] for start in range(0, len(values), self.chunk_size))
+        return self.writeChunks(path, chunks)
+
+    def writeChunks(self, path, chunks):
+        """
+            Este método escribe una secuencia de bloques de valores en el archivo 'path' y devuelve cuántos escribió.
+            Los bloques pueden provenir directamente de iter_chunks, por lo que nunca se guarda la secuencia completa.
+        """
+        written = 0
+        with open(path, 'w', buffering=self.buffer_size) as f:
+            for chunk in chunks:
+                f.write(self.formatChunk(chunk))
+                written += len(chunk)
+        return written
+
+    def readChunks(self, path, chunk_size=None):
+        """
+            Este método lee un archivo de texto escrito con esta clase y devuelve sus valores por bloques de flotantes.
+        """
+        # Cada línea ocupa al menos dos caracteres, por lo que se leen bloques de tamaño aproximado en bytes
+        size_hint = (chunk_size or self.chunk_size) * 8
+        with open(path, 'r', buffering=self.buffer_size) as f:
+            while True:
+                lines = f.readlines(size_hint)
+                if not lines:
+                    break
+                yield np.array(lines, dtype=np.float64)
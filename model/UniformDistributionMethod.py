@@ -1,28 +1,63 @@
 import numpy as np
 
+from model.RandomSource import RandomSource
+
 class UniformDistributionMethod:
     """
         Esta clase implementa el método de distribución uniforme para generar números pseudoaleatorios.
     """
 
-    def __init__(self, min, max, num_amount):
+    __slots__ = ('min', 'max', 'num_amount', 'random_source', 'ri_values', 'ni_values')
+
+    def __init__(self, min, max, num_amount, seed=None, bit_generator='PCG64'):
         """
             Este es el método constructor de la clase UniformDistributionMethod.
             Inicializa la clase con los parámetros dados.
+            'seed' puede ser un entero, un numpy.random.SeedSequence o un numpy.random.Generator; con la misma semilla
+            se obtiene siempre la misma secuencia. 'bit_generator' puede ser 'PCG64', 'Philox' o 'SFC64'.
         """
         self.min = min  # Valor minimo para el rango de numeros aleatorios a crear
         self.max = max  # Valor maximo para el rango de numeros aleatorios a crear
         self.num_amount = num_amount  # Cantidad de numeros a generar
-        self.ri_values = []  # Lista para almacenar los valores de Ri
-        self.ni_values = []  # Lista para almacenar los valores de Ni
+        self.random_source = RandomSource(seed, bit_generator)  # Fuente de aleatoriedad
+        self.ri_values = np.empty(0, dtype=np.float64)  # Arreglo para almacenar los valores de Ri
+        self.ni_values = np.empty(0, dtype=np.float64)  # Arreglo para almacenar los valores de Ni
+
+    def spawn(self, n):
+        """
+            Este método crea n copias del método con fuentes de aleatoriedad independientes entre sí,
+            para que varios trabajadores puedan generar en paralelo sin compartir estado.
+        """
+        return [UniformDistributionMethod(self.min, self.max, self.num_amount, source.seed_sequence,
+                                          source.bit_generator)
+                for source in self.random_source.spawn(n)]
 
-    def fillRiValues(self):
+    def fillRiValues(self, block_size=1 << 20, statistics=None):
         """
             Este método genera y almacena valores de Ri utilizando una distribución uniforme.
+            Los valores se extraen del generador en bloques de 'block_size' y se conservan con precisión completa.
+            Si se recibe un StreamingStatistics, cada bloque se acumula en él apenas se extrae.
         """
-        for i in range(self.num_amount):
-            value = round(np.random.uniform(), 5)
-            self.ri_values.append(round(value, 5))
+        self.ri_values = np.empty(self.num_amount)
+        for start in range(0, len(self.ri_values), block_size):
+            block = self.random_source.fillUniform(self.ri_values[start:start + block_size], block_size=block_size)
+            if statistics is not None:
+                statistics.update(block)
+
+    def iter_chunks(self, chunk_size=65536, statistics=None):
+        """
+            Este método genera los valores en bloques de 'chunk_size' sin almacenarlos, con memoria acotada.
+            Cada bloque es una tupla (ri, ni) de arreglos NumPy; el último bloque puede ser más corto.
+            Si se recibe un StreamingStatistics, cada bloque de Ri se acumula en él antes de entregarse.
+            Los bloques se extraen de la misma fuente de aleatoriedad que fillRiValues.
+        """
+        min_value = self.obtainMinValue()
+        max_value = self.obtainMaxValue()
+        for start in range(0, self.num_amount, chunk_size):
+            ri_block = self.random_source.fillUniform(np.empty(min(chunk_size, self.num_amount - start)))
+            if statistics is not None:
+                statistics.update(ri_block)
+            yield ri_block, min_value + (max_value - min_value) * ri_block
 
     def obtainMinValue(self):
         """
@@ -43,9 +78,7 @@ class UniformDistributionMethod:
         min_value = self.obtainMinValue()
         max_value = self.obtainMaxValue()
 
-        for i in range(len(self.ri_values)):
-            value = min_value + (max_value - min_value) * self.ri_values[i]
-            self.ni_values.append(round(value, 5))
+        self.ni_values = min_value + (max_value - min_value) * np.asarray(self.ri_values, dtype=np.float64)
 
     def get_ri_values_array(self):
         """
@@ -0,0 +1,33 @@
+import pytest
+
+from CommandLine import MAX_MODULUS_EXPONENT, main
+
+
+@pytest.mark.parametrize('argv, message', [
+    (['lcm', '--xo', '-5', '--k', '-5', '--c', '-5', '--g', '-1'], "The values of xo, k, and c cannot be negative."),
+    (['lcm', '--xo', '3', '--k', '-2', '--c', '1', '--g', '8'], "The values of xo, k, and c cannot be negative."),
+    (['lcm', '--xo', '3', '--k', '2', '--c', '-1', '--g', '8'], "The values of xo, k, and c cannot be negative."),
+    (['mcm', '--xo', '-5', '--t', '-5', '--g', '0'], "The values of xo and t cannot be negative."),
+    (['mcm', '--xo', '3', '--t', '-1', '--g', '8'], "The values of xo and t cannot be negative."),
+    (['lcm', '--xo', '0', '--k', '0', '--c', '1', '--g', '0'], "The value of g must be between 1 and 1023."),
+    (['mcm', '--xo', '0', '--t', '0', '--g', '0'], "The value of g must be between 1 and 1023."),
+    (['lcm', '--xo', '3', '--k', '2', '--c', '1', '--g', '2000'], "The value of g must be between 1 and 1023."),
+    (['mcm', '--xo', '3', '--t', '2', '--g', str(MAX_MODULUS_EXPONENT + 1)],
+     "The value of g must be between 1 and 1023."),
+])
+def test_rejects_invalid_congruential_parameters(argv, message, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(argv + ['--iterations', '3'])
+    assert exit_info.value.code == 2
+    assert message in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('argv', [
+    ['lcm', '--xo', '3', '--k', '2', '--c', '1', '--g', str(MAX_MODULUS_EXPONENT)],
+    ['mcm', '--xo', '3', '--t', '2', '--g', str(MAX_MODULUS_EXPONENT)],
+])
+def test_accepts_largest_modulus_exponent(argv, capsys):
+    assert main(argv + ['--iterations', '3']) == 0
+    values = [float(line) for line in capsys.readouterr().out.split()]
+    assert len(values) == 3
+    assert all(0 <= value <= 1 for value in values)
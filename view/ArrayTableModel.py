@@ -0,0 +1,61 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+
+class ArrayTableModel(QAbstractTableModel):
+    """
+        Esta clase es un modelo de tabla virtual sobre los arreglos de valores generados.
+        La primera columna es el número de iteración y las demás leen directamente de los arreglos, sin copiarlos.
+        Qt solo pide el texto de las celdas visibles, así que cargar una tabla de cualquier tamaño no crea ningún
+        objeto por fila y el texto de cada valor se calcula únicamente cuando se muestra.
+    """
+
+    def __init__(self, header_labels, columns):
+        """
+            Este es el método constructor de la clase ArrayTableModel.
+            Recibe las etiquetas del encabezado (la primera corresponde a la columna de iteración) y la lista de
+            arreglos de datos, uno por cada columna restante.
+        """
+        super().__init__()
+        self.header_labels = header_labels  # Etiquetas del encabezado
+        self.columns = columns  # Arreglos con los datos de cada columna
+
+    def rowCount(self, parent=QModelIndex()):
+        """
+            Este método devuelve la cantidad de filas de la tabla, una por cada valor generado.
+        """
+        if parent.isValid() or not self.columns:
+            return 0
+        return len(self.columns[0])
+
+    def columnCount(self, parent=QModelIndex()):
+        """
+            Este método devuelve la cantidad de columnas de la tabla, incluida la de iteración.
+        """
+        if parent.isValid():
+            return 0
+        return len(self.header_labels)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """
+            Este método devuelve el contenido de una celda. El texto se calcula solo para las celdas que se muestran.
+        """
+        if not index.isValid():
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if index.column() == 0:
+                return str(index.row() + 1)
+            return str(self.columns[index.column() - 1][index.row()])
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """
+            Este método devuelve las etiquetas del encabezado horizontal de la tabla.
+        """
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.header_labels[section]
+        return None
@@ -0,0 +1,79 @@
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class GenerationSignals(QObject):
+    """
+        Esta clase agrupa las señales de un GenerationWorker.
+        QRunnable no hereda de QObject, por lo que no puede declarar señales propias.
+    """
+
+    # Porcentaje de avance de la generación, de 0 a 100.
+    progress = pyqtSignal(int)
+
+    # Resultado de la tarea, emitido solo si terminó sin errores y sin ser cancelada.
+    finished = pyqtSignal(object)
+
+    # Mensaje de error, emitido si la tarea lanzó una excepción.
+    failed = pyqtSignal(str)
+
+    # Emitida si la tarea se detuvo porque se pidió cancelarla.
+    cancelled = pyqtSignal()
+
+
+class GenerationWorker(QRunnable):
+    """
+        Esta clase ejecuta una tarea de generación y exportación en un hilo del QThreadPool, fuera del hilo de la
+        interfaz gráfica. La tarea recibe el propio trabajador, con el que informa su avance (reportProgress) y consulta
+        entre bloque y bloque si debe detenerse (isCancelled). Los resultados se entregan mediante señales, que Qt
+        despacha en el hilo de la interfaz.
+    """
+
+    def __init__(self, task):
+        """
+            Este es el método constructor de la clase GenerationWorker.
+            Recibe la tarea a ejecutar: una función que recibe el trabajador y devuelve el resultado.
+        """
+        super().__init__()
+        # El Presenter conserva la referencia al trabajador, así que Qt no debe destruirlo al terminar run()
+        self.setAutoDelete(False)
+        self.task = task  # Funcion que genera y exporta los valores
+        self.signals = GenerationSignals()  # Señales de avance y resultado
+        self.cancel_requested = False  # Indica si se pidio cancelar la tarea
+        self.last_percent = -1  # Ultimo porcentaje emitido, para no repetir señales
+
+    def cancel(self):
+        """
+            Este método pide a la tarea que se detenga; la tarea lo comprueba al terminar cada bloque.
+        """
+        self.cancel_requested = True
+
+    def isCancelled(self):
+        """
+            Este método indica si se pidió cancelar la tarea.
+        """
+        return self.cancel_requested
+
+    def reportProgress(self, done, total):
+        """
+            Este método informa que se procesaron 'done' de 'total' valores.
+            La señal solo se emite cuando cambia el porcentaje, para no saturar el hilo de la interfaz.
+        """
+        percent = 100 if total <= 0 else min(100, done * 100 // total)
+        if percent != self.last_percent:
+            self.last_percent = percent
+            self.signals.progress.emit(percent)
+
+    def run(self):
+        """
+            Este método ejecuta la tarea en el hilo del QThreadPool y emite la señal correspondiente a su resultado.
+        """
+        try:
+            result = self.task(self)
+        except Exception as error:
+            self.signals.failed.emit(str(error))
+            return
+
+        if self.cancel_requested:
+            self.signals.cancelled.emit()
+        else:
+            self.signals.finished.emit(result)
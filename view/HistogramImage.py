@@ -0,0 +1,22 @@
+def saveHistogramImage(path, histogram, title, xlabel='Intervals', ylabel='Frequencies'):
+    """
+        Esta función dibuja un histograma ya calculado (model.Histogram) en una imagen PNG, fuera de pantalla.
+        Usa directamente una Figure de matplotlib con el lienzo Agg, sin pyplot ni ventanas, por lo que puede
+        ejecutarse en un hilo secundario sin bloquear la ventana principal. matplotlib se importa solo al llamarla.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    edges = histogram.getEdges()
+    figure = Figure(figsize=(8, 5))
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+    axes.bar(edges[:-1], histogram.getCounts(), width=edges[1:] - edges[:-1], align='edge', edgecolor='black')
+
+    # Etiquetar los ejes
+    axes.set_title(title)
+    axes.set_xlabel(xlabel)
+    axes.set_ylabel(ylabel)
+
+    figure.savefig(path)
+    return path
@@ -1,7 +1,8 @@
-import pyqtgraph as pg
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtWidgets import QWidget, QLabel, QSpinBox, QPushButton, QFrame, QTableWidget, QTableWidgetItem, QHeaderView
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWidgets import QWidget, QLabel, QSpinBox, QPushButton, QFrame, QTableView, QHeaderView
 from PyQt6.QtGui import QFont
+from view.ArrayTableModel import ArrayTableModel
+from view.ScatterPlot import addScatterItem
 
 class MSMTabContent(QWidget):
     """
@@ -62,13 +63,14 @@ class MSMTabContent(QWidget):
         self.data2 = None
         self.data3 = None
 
-        # Inicializa un QTableWidget. Esto se utilizará para mostrar los datos.
-        self.table = QTableWidget(self)
+        # Inicializa un QTableView y su modelo. Esto se utilizará para mostrar los datos.
+        self.table = QTableView(self)
+        self.table_model = None
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
 
         # Establece el estilo de la tabla.
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 gridline-color: black;
                 color: black;
             }
@@ -103,11 +105,25 @@ class MSMTabContent(QWidget):
         self.table.resize(640, 460)
 
         # Deshabilitar la edición del contenido de la tabla.
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
 
         # Ocultar el encabezado vertical de la tabla.
         self.table.verticalHeader().setVisible(False)
 
+        # Inicializa el gráfico en None. Se crea la primera vez que se muestran datos, para no importar pyqtgraph al
+        # abrir la aplicación.
+        self.graphWidget = None
+
+        # Conecta la señal del boton cuando se da click sobre el.
+        self.generate_button.clicked.connect(self.generate_button_clicked)
+
+    def createGraphWidget(self):
+        """
+            Este método crea y configura el PlotWidget del gráfico.
+            Se llama la primera vez que se generan datos, de modo que pyqtgraph solo se importa cuando se necesita.
+        """
+        import pyqtgraph as pg
+
         # Inicializa un PlotWidget. Esto se utilizará para mostrar el gráfico.
         self.graphWidget = pg.PlotWidget(self)
 
@@ -130,8 +146,8 @@ class MSMTabContent(QWidget):
         # Establece el color del título del gráfico en negro.
         self.graphWidget.setTitle('Scatter Plot', color='k')
 
-        # Conecta la señal del boton cuando se da click sobre el.
-        self.generate_button.clicked.connect(self.generate_button_clicked)
+        # Muestra el gráfico, ya que se crea cuando la pestaña ya es visible.
+        self.graphWidget.show()
 
     def set_data(self, data1, data2, data3):
         """
@@ -142,61 +158,46 @@ class MSMTabContent(QWidget):
         self.data2 = data2
         self.data3 = data3
 
+    def get_ri_values(self):
+        """
+            Este método devuelve los valores Ri de la última generación, o None si todavía no se generaron datos.
+        """
+        return self.data2
+
     def generateTable(self):
         """
            Este método genera la tabla y el diagrama de dispersión para la pestaña.
-            Primero verifica si los datos no son None, luego borra la tabla y el gráfico.
-            Llena la tabla con datos y crea un diagrama de dispersión.
+            Primero verifica si los datos no son None, luego borra el gráfico.
+            Asigna los datos a la tabla mediante un modelo virtual y crea un diagrama de dispersión.
         """
 
         # Comprobar si los datos son None.
         if self.data1 is None or self.data2 is None or self.data3 is None:
             return
 
-        # Borra la tabla y el gráfico antes de agregar nuevos datos.
-        self.table.clearContents()
-        self.graphWidget.clear()
+        # Crea el gráfico la primera vez que se usa.
+        if self.graphWidget is None:
+            self.createGraphWidget()
 
-        # Establece el número de filas y columnas de la tabla.
-        self.table.setRowCount(self.iterations_amount_spinbox.value())
-        self.table.setColumnCount(4)
+        # Borra el gráfico antes de agregar nuevos datos.
+        self.graphWidget.clear()
 
         # Establece las etiquetas del encabezado de la tabla.
         header_labels = ['Iteration', 'Xi', 'Ri', 'Ni']
-        self.table.setHorizontalHeaderLabels(header_labels)
-
-        # Llenar la tabla con datos.
-        for i in range(self.iterations_amount_spinbox.value()):
-            item_i = QTableWidgetItem(str(i + 1))
-            item_i.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 0, item_i)
 
-            item1 = QTableWidgetItem(str(self.data1[i]))
-            item1.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 1, item1)
-
-            item2 = QTableWidgetItem(str(self.data2[i]))
-            item2.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 2, item2)
-
-            item3 = QTableWidgetItem(str(self.data3[i]))
-            item3.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 3, item3)
+        # Muestra los datos con un modelo virtual, que lee los arreglos directamente y solo formatea las filas
+        # visibles. Se conserva una referencia al modelo mientras la tabla lo usa.
+        self.table_model = ArrayTableModel(header_labels, [self.data1, self.data2, self.data3])
+        self.table.setModel(self.table_model)
 
         # Establece los encabezados de las columnas en negrita.
         font = QFont()
         font.setBold(True)
         self.table.horizontalHeader().setFont(font)
 
-        # Crea un diagrama de dispersión con los datos.
-        scatter = pg.ScatterPlotItem(size=10)
-        scatter.setBrush(pg.mkBrush('r'))
-
-        for i in range(1, self.iterations_amount_spinbox.value() + 1):
-            scatter.addPoints([i], [self.data2[i - 1]])
-
-        # Agregue el diagrama de dispersión al widget de gráfico.
-        self.graphWidget.addItem(scatter)
+        # Agrega al widget de gráfico un diagrama de dispersión con los datos (Ri), reducido según la vista si son
+        # muchos puntos.
+        addScatterItem(self.graphWidget, self.data2)
 
         # Ajustar el rango del gráfico para que se ajuste a los datos.
         self.graphWidget.getViewBox().autoRange()
@@ -1,7 +1,8 @@
 import os
 
+from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import QMainWindow, QTabWidget
+from PyQt6.QtWidgets import QMainWindow, QTabWidget, QWidget, QHBoxLayout, QProgressBar, QPushButton
 from view.LCMTabContent import LCMTabContent
 from view.MCMTabContent import MCMTabContent
 from view.MSMTabContent import MSMTabContent
@@ -15,6 +16,12 @@ class MainFrame(QMainWindow):
          Hereda de QMainWindow, un tipo de ventana principal de la aplicación en PyQt.
     """
 
+    # Definir una señal PyQt que se emitirá cuando se haga clic en el botón cancelar.
+    cancel_button_clicked = pyqtSignal()
+
+    # Definir una señal PyQt que se emitirá cuando se haga clic en el botón de pruebas estadísticas.
+    tests_button_clicked = pyqtSignal()
+
     def __init__(self):
         """
             Este es el método constructor de la clase MainFrame.
@@ -51,5 +58,60 @@ class MainFrame(QMainWindow):
         self.tab_widget.addTab(self.tab4, "Uniform Distribution Method")
         self.tab_widget.addTab(self.tab5, "Normal Distribution Method")
 
+        # Inicializa la barra de progreso y el botón de cancelar de la generación en curso.
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setFixedWidth(200)
+        self.cancel_button = QPushButton("Cancel")
+
+        # Inicializa el botón que aplica las pruebas estadísticas a los valores Ri de la pestaña actual.
+        self.tests_button = QPushButton("Run Tests")
+
+        # Ubica la barra de progreso y los botones en la esquina de la barra de pestañas, para no quitar espacio al
+        # contenido de las pestañas.
+        self.progress_widget = QWidget()
+        progress_layout = QHBoxLayout(self.progress_widget)
+        progress_layout.setContentsMargins(0, 0, 0, 0)
+        progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.cancel_button)
+        self.progress_widget.setVisible(False)
+
+        corner_widget = QWidget()
+        corner_layout = QHBoxLayout(corner_widget)
+        corner_layout.setContentsMargins(0, 0, 5, 0)
+        corner_layout.addWidget(self.progress_widget)
+        corner_layout.addWidget(self.tests_button)
+        self.tab_widget.setCornerWidget(corner_widget)
+
+        # Conecta las señales de los botones cuando se da click sobre ellos.
+        self.cancel_button.clicked.connect(self.cancel_button_clicked)
+        self.tests_button.clicked.connect(self.tests_button_clicked)
+
         # Establece QTabWidget como el widget central de la ventana principal.
         self.setCentralWidget(self.tab_widget)
+
+    def start_progress(self):
+        """
+            Este método muestra la barra de progreso en cero y habilita el botón de cancelar.
+        """
+        self.progress_bar.setValue(0)
+        self.cancel_button.setEnabled(True)
+        self.progress_widget.setVisible(True)
+
+    def set_progress(self, percent):
+        """
+            Este método actualiza el porcentaje de la barra de progreso.
+        """
+        self.progress_bar.setValue(percent)
+
+    def cancel_progress(self):
+        """
+            Este método deshabilita el botón de cancelar mientras la generación termina su bloque actual.
+        """
+        self.cancel_button.setEnabled(False)
+
+    def finish_progress(self):
+        """
+            Este método oculta la barra de progreso al terminar la generación.
+        """
+        self.progress_widget.setVisible(False)
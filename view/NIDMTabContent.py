@@ -1,9 +1,9 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import pyqtgraph as pg
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtWidgets import QWidget, QLabel, QSpinBox, QPushButton, QFrame, QTableWidget, QTableWidgetItem, QHeaderView
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWidgets import QWidget, QLabel, QSpinBox, QPushButton, QFrame, QTableView, QHeaderView
 from PyQt6.QtGui import QFont
+from model.Histogram import Histogram
+from view.ArrayTableModel import ArrayTableModel
 
 class NIDMTabContent(QWidget):
     """
@@ -63,13 +63,17 @@ class NIDMTabContent(QWidget):
         self.data1 = None
         self.data2 = None
 
-        # Inicializa un QTableWidget. Esto se utilizará para mostrar los datos.
-        self.table = QTableWidget(self)
+        # Inicializa el histograma en None. Se calcula una sola vez por generación y se comparte con la exportación.
+        self.histogram = None
+
+        # Inicializa un QTableView y su modelo. Esto se utilizará para mostrar los datos.
+        self.table = QTableView(self)
+        self.table_model = None
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
 
         # Establece el estilo de la tabla.
         self.table.setStyleSheet("""
-                                            QTableWidget {
+                                            QTableView {
                                                 gridline-color: black;
                                                 color: black;
                                             }
@@ -104,11 +108,25 @@ class NIDMTabContent(QWidget):
         self.table.resize(640, 460)
 
         # Deshabilitar la edición del contenido de la tabla.
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
 
         # Ocultar el encabezado vertical de la tabla.
         self.table.verticalHeader().setVisible(False)
 
+        # Inicializa el gráfico en None. Se crea la primera vez que se muestran datos, para no importar pyqtgraph al
+        # abrir la aplicación.
+        self.graphWidget = None
+
+        # Conecta la señal del boton cuando se da click sobre el.
+        self.generate_button.clicked.connect(self.generate_button_clicked)
+
+    def createGraphWidget(self):
+        """
+            Este método crea y configura el PlotWidget del gráfico.
+            Se llama la primera vez que se generan datos, de modo que pyqtgraph solo se importa cuando se necesita.
+        """
+        import pyqtgraph as pg
+
         # Inicializa un PlotWidget. Esto se utilizará para mostrar el gráfico.
         self.graphWidget = pg.PlotWidget(self)
 
@@ -130,8 +148,8 @@ class NIDMTabContent(QWidget):
         # Establece el color del título del gráfico en negro.
         self.graphWidget.setTitle('Gauss Bell', color='k')
 
-        # Conecta la señal del boton cuando se da click sobre el.
-        self.generate_button.clicked.connect(self.generate_button_clicked)
+        # Muestra el gráfico, ya que se crea cuando la pestaña ya es visible.
+        self.graphWidget.show()
 
     def set_data(self, data1, data2):
         """
@@ -141,6 +159,12 @@ class NIDMTabContent(QWidget):
         self.data1 = data1
         self.data2 = data2
 
+    def get_ri_values(self):
+        """
+            Este método devuelve los valores Ri de la última generación, o None si todavía no se generaron datos.
+        """
+        return self.data1
+
     def generateTable(self):
         """
             Este método genera la tabla y un grafico que representa la Campana de Gauss para la pestaña.
@@ -152,42 +176,32 @@ class NIDMTabContent(QWidget):
         if self.data1 is None or self.data2 is None:
             return
 
-        # Borra la tabla y el gráfico antes de agregar nuevos datos.
-        self.table.clearContents()
-        self.graphWidget.clear()
+        # Importa pyqtgraph y crea el gráfico la primera vez que se usa.
+        import pyqtgraph as pg
+        if self.graphWidget is None:
+            self.createGraphWidget()
 
-        # Establece el número de filas y columnas de la tabla.
-        self.table.setRowCount(self.iterations_amount_spinbox.value())
-        self.table.setColumnCount(3)
+        # Borra el gráfico antes de agregar nuevos datos.
+        self.graphWidget.clear()
 
         # Establece las etiquetas del encabezado de la tabla.
         header_labels = ['Iteration', 'Ri', 'Ni']
-        self.table.setHorizontalHeaderLabels(header_labels)
 
-        # Llenar la tabla con datos.
-        for i in range(self.iterations_amount_spinbox.value()):
-            item_i = QTableWidgetItem(str(i + 1))
-            item_i.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 0, item_i)
-
-            item1 = QTableWidgetItem(str(self.data1[i]))
-            item1.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 1, item1)
-
-            item2 = QTableWidgetItem(str(self.data2[i]))
-            item2.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 2, item2)
+        # Muestra los datos con un modelo virtual, que lee los arreglos directamente y solo formatea las filas
+        # visibles. Se conserva una referencia al modelo mientras la tabla lo usa.
+        self.table_model = ArrayTableModel(header_labels, [self.data1, self.data2])
+        self.table.setModel(self.table_model)
 
         # Establece los encabezados de las columnas en negrita.
         font = QFont()
         font.setBold(True)
         self.table.horizontalHeader().setFont(font)
 
-        # Crea un histograma con los datos.
-        counts, bins = np.histogram(self.data2, bins=121)  # Ni
+        # Calcula una sola vez el histograma de Ni, con 121 intervalos entre el mínimo y el máximo.
+        self.histogram = Histogram.fromValues(self.data2, 121)
 
         # Crea un gráfico de barras con los datos del histograma.
-        bg1 = pg.BarGraphItem(x=np.arange(len(counts)), height=counts, width=0.6)
+        bg1 = pg.BarGraphItem(x=np.arange(self.histogram.bins), height=self.histogram.getCounts(), width=0.6)
 
         # Agrega el gráfico de barras al widget de gráfico.
         self.graphWidget.addItem(bg1)
@@ -195,22 +209,17 @@ class NIDMTabContent(QWidget):
         # Ajustar el rango del gráfico para que se ajuste a los datos.
         self.graphWidget.getViewBox().autoRange()
 
-        # Ahora vamos a crear el mismo gráfico con matplotlib, primero asignamos datos:
-        data = self.data2
-
-        # Calcular frecuencias y contenedores.
-        counts, bins = np.histogram(data, bins=121)
-
-        # Etiquetar los ejes
-        plt.title('Gauss Bell')
-        plt.xlabel('Intervals')
-        plt.ylabel('Frequencies')
-
-        # Gráfico de barras con datos
-        plt.bar(range(1, len(bins)), counts)
+    def get_histogram(self):
+        """
+            Este método devuelve el último histograma calculado, o None si todavía no se generaron datos.
+        """
+        return self.histogram
 
-        # Mostrar el gráfico
-        plt.show()
+    def get_histogram_title(self):
+        """
+            Este método devuelve el título del histograma, usado también al exportarlo como imagen.
+        """
+        return 'Gauss Bell'
 
     def get_xi_spin_box_value(self):
         """
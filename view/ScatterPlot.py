@@ -0,0 +1,27 @@
+import numpy as np
+
+# Cantidad de puntos a partir de la cual el diagrama de dispersión se reduce según la vista
+DOWNSAMPLING_THRESHOLD = 100000
+
+
+def addScatterItem(plot_widget, values, threshold=DOWNSAMPLING_THRESHOLD):
+    """
+        Esta función agrega a 'plot_widget' el diagrama de dispersión de una secuencia de valores (iteración contra
+        valor) con una sola asignación de datos, en lugar de agregar los puntos uno por uno, y lo devuelve.
+        Si la secuencia supera 'threshold' puntos, solo se dibuja la parte visible del gráfico y se reduce con el
+        método 'peak', que conserva el mínimo y el máximo de cada grupo de puntos, de modo que el gráfico sigue siendo
+        fluido con millones de valores y los extremos no desaparecen. La reducción se activa después de agregar el
+        diagrama al gráfico, porque necesita la vista que lo contiene.
+    """
+    import pyqtgraph as pg
+
+    values = np.asarray(values, dtype=np.float64)
+    iterations = np.arange(1, len(values) + 1, dtype=np.float64)
+
+    scatter = pg.PlotDataItem(iterations, values, pen=None, symbol='o', symbolSize=10,
+                              symbolBrush=pg.mkBrush('r'))
+    plot_widget.addItem(scatter)
+    if len(values) > threshold:
+        scatter.setClipToView(True)
+        scatter.setDownsampling(auto=True, method='peak')
+    return scatter
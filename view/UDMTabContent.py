@@ -1,9 +1,8 @@
-import numpy as np
-import matplotlib.pyplot as plt
-import pyqtgraph as pg
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtWidgets import QWidget, QLabel, QSpinBox, QPushButton, QFrame, QTableWidget, QTableWidgetItem, QHeaderView
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWidgets import QWidget, QLabel, QSpinBox, QPushButton, QFrame, QTableView, QHeaderView
 from PyQt6.QtGui import QFont
+from model.Histogram import Histogram
+from view.ArrayTableModel import ArrayTableModel
 
 class UDMTabContent(QWidget):
     """
@@ -56,13 +55,17 @@ class UDMTabContent(QWidget):
         self.data1 = None
         self.data2 = None
 
-        # Inicializa un QTableWidget. Esto se utilizará para mostrar los datos.
-        self.table = QTableWidget(self)
+        # Inicializa el histograma en None. Se calcula una sola vez por generación y se comparte con la exportación.
+        self.histogram = None
+
+        # Inicializa un QTableView y su modelo. Esto se utilizará para mostrar los datos.
+        self.table = QTableView(self)
+        self.table_model = None
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
 
         # Establece el estilo de la tabla.
         self.table.setStyleSheet("""
-                                    QTableWidget {
+                                    QTableView {
                                         gridline-color: black;
                                         color: black;
                                     }
@@ -97,11 +100,25 @@ class UDMTabContent(QWidget):
         self.table.resize(640, 460)
 
         # Deshabilitar la edición del contenido de la tabla.
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
 
         # Ocultar el encabezado vertical de la tabla.
         self.table.verticalHeader().setVisible(False)
 
+        # Inicializa el gráfico en None. Se crea la primera vez que se muestran datos, para no importar pyqtgraph al
+        # abrir la aplicación.
+        self.graphWidget = None
+
+        # Conecta la señal del boton cuando se da click sobre el.
+        self.generate_button.clicked.connect(self.generate_button_clicked)
+
+    def createGraphWidget(self):
+        """
+            Este método crea y configura el PlotWidget del gráfico.
+            Se llama la primera vez que se generan datos, de modo que pyqtgraph solo se importa cuando se necesita.
+        """
+        import pyqtgraph as pg
+
         # Inicializa un PlotWidget. Esto se utilizará para mostrar el gráfico.
         self.graphWidget = pg.PlotWidget(self)
 
@@ -124,8 +141,8 @@ class UDMTabContent(QWidget):
         # Establece el color del título del gráfico en negro.
         self.graphWidget.setTitle('Histogram', color='k')
 
-        # Conecta la señal del boton cuando se da click sobre el.
-        self.generate_button.clicked.connect(self.generate_button_clicked)
+        # Muestra el gráfico, ya que se crea cuando la pestaña ya es visible.
+        self.graphWidget.show()
 
     def set_data(self, data1, data2):
         """
@@ -135,52 +152,48 @@ class UDMTabContent(QWidget):
         self.data1 = data1  # Ri
         self.data2 = data2  # Ni
 
+    def get_ri_values(self):
+        """
+            Este método devuelve los valores Ri de la última generación, o None si todavía no se generaron datos.
+        """
+        return self.data1
+
     def generateTable(self):
         """
             Este método genera la tabla y el histograma para la pestaña.
-            Primero verifica si los datos no son None, luego borra la tabla y el gráfico.
-            Llena la tabla con datos y crea un histograma.
+            Primero verifica si los datos no son None, luego borra el gráfico.
+            Asigna los datos a la tabla mediante un modelo virtual y crea un histograma.
         """
 
         # Comprobar si los datos son None.
         if self.data1 is None or self.data2 is None:
             return
 
-        # Borra la tabla y el gráfico antes de agregar nuevos datos.
-        self.table.clearContents()
-        self.graphWidget.clear()
+        # Importa pyqtgraph y crea el gráfico la primera vez que se usa.
+        import pyqtgraph as pg
+        if self.graphWidget is None:
+            self.createGraphWidget()
 
-        # Establece el número de filas y columnas de la tabla.
-        self.table.setRowCount(len(self.data1))
-        self.table.setColumnCount(3)
+        # Borra el gráfico antes de agregar nuevos datos.
+        self.graphWidget.clear()
 
         # Establece las etiquetas del encabezado de la tabla.
         header_labels = ['Iteration', 'Ri', 'Ni']
-        self.table.setHorizontalHeaderLabels(header_labels)
-
-        # Llenar la tabla con datos.
-        for i in range(len(self.data1)):
-            item_i = QTableWidgetItem(str(i + 1))
-            item_i.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 0, item_i)
-
-            item1 = QTableWidgetItem(str(self.data1[i]))  # Ri
-            item1.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 1, item1)
 
-            item2 = QTableWidgetItem(str(self.data2[i]))  # Ni
-            item2.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 2, item2)
+        # Muestra los datos con un modelo virtual, que lee los arreglos directamente y solo formatea las filas
+        # visibles. Se conserva una referencia al modelo mientras la tabla lo usa.
+        self.table_model = ArrayTableModel(header_labels, [self.data1, self.data2])
+        self.table.setModel(self.table_model)
 
         # Establece los encabezados de las columnas en negrita.
         font = QFont()
         font.setBold(True)
         self.table.horizontalHeader().setFont(font)
 
-        # Crea un histograma con los datos.
-        num_bins = 51  # O cualquier otro número que prefieras
-        y, x = np.histogram(self.data1, bins=np.linspace(0, 1, num_bins + 1))  # Ri
-        curve = pg.PlotCurveItem(x, y, stepMode=True, fillLevel=0, brush=(0, 0, 255, 80))
+        # Calcula una sola vez el histograma de Ri, con intervalos de bordes fijos en [0, 1].
+        self.histogram = Histogram(51, 0.0, 1.0).add(self.data1)
+        curve = pg.PlotCurveItem(self.histogram.getEdges(), self.histogram.getCounts(), stepMode=True, fillLevel=0,
+                                 brush=(0, 0, 255, 80))
 
         # Agrega el histograma al widget de gráfico.
         self.graphWidget.addItem(curve)
@@ -188,16 +201,17 @@ class UDMTabContent(QWidget):
         # Ajustar el rango del gráfico para que se ajuste a los datos.
         self.graphWidget.getViewBox().autoRange()
 
-        # Crea un histograma con matplotlib
-        plt.hist(self.data1, bins=51, range=(0, 1), edgecolor='black')
-
-        # Etiquetar los ejes
-        plt.title('Histogram')
-        plt.xlabel('Intervals')
-        plt.ylabel('Frequencies')
+    def get_histogram(self):
+        """
+            Este método devuelve el último histograma calculado, o None si todavía no se generaron datos.
+        """
+        return self.histogram
 
-        # Mostrar la grafico
-        plt.show()
+    def get_histogram_title(self):
+        """
+            Este método devuelve el título del histograma, usado también al exportarlo como imagen.
+        """
+        return 'Histogram'
 
     def get_min_spin_box_value(self):
         """